@@ -7,13 +7,16 @@ and download optimized routing results.
 """
 
 import os
+import io
+import time
+import hashlib
+import concurrent.futures
 import streamlit as st
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
+from typing import TYPE_CHECKING, Optional
 from dotenv import load_dotenv
-import tempfile
-import io
 import streamlit.components.v1 as components
 
 # Load environment variables
@@ -28,10 +31,11 @@ from src.utils.csv_parser import CSVParser
 from src.utils.yaml_parser import YAMLParser
 from src.utils.distance_calculator import DistanceCalculator
 from src.utils.hub_routing import MultiHubRoutingManager
-from src.solver.two_tier_vrp_solver import MultiHubVRPSolver
-from src.output.excel_generator import ExcelGenerator
-from src.output.csv_generator import CSVGenerator
-from src.visualization.map_visualizer import MapVisualizer
+
+# The solver (ortools), output writers (openpyxl) and map (folium) modules are
+# imported where they are used, so the upload page doesn't pay for them on startup
+if TYPE_CHECKING:
+    from src.visualization.map_visualizer import MapVisualizer
 
 
 # Page configuration
@@ -88,70 +92,60 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+# Session state keys and their starting values (fleet, cache_config and
+# vehicle_config are loaded from conf.yaml in initialize_session_state)
+SESSION_DEFAULTS = {
+    'orders': None,
+    'orders_upload': None,  # (content hash, preview, summary) of the parsed CSV upload
+    'solution': None,
+    'excel_path': None,
+    'csv_path': None,
+    'csv_summary_path': None,
+    'depot': None,
+    # Multi-hub support
+    'hubs_config': None,  # MultiHubConfig object
+    'hub_routing_manager': None,  # MultiHubRoutingManager
+    'solution_key': None,  # Fingerprint of the current solution's routes (map cache key)
+    'route_df': None,  # Route details table for current solution
+    'route_df_by_vehicle': None,  # Route details table split per vehicle (filter lookups)
+    'last_solve_key': None,  # Fingerprint of the inputs behind the current solution
+    'config_modified': False,  # Track if config has been modified from default
+    'vehicle_editor_data': None,  # Input table of the vehicle editor (edits are kept by the widget)
+}
+
+
 def initialize_session_state():
-    """Initialize session state variables"""
-    if 'orders' not in st.session_state:
-        st.session_state.orders = None
+    """Initialize session state variables (once per session; later reruns return immediately)"""
+    if 'session_initialized' in st.session_state:
+        return
+
+    for key, default in SESSION_DEFAULTS.items():
+        st.session_state.setdefault(key, default)
+
     if 'fleet' not in st.session_state:
-        # Auto-load default fleet from conf.yaml
-        default_yaml_path = "conf.yaml"
-        if os.path.exists(default_yaml_path):
+        # Auto-load default fleet (and cache settings) from conf.yaml
+        st.session_state.fleet = None
+        st.session_state.cache_config = {}  # Distance cache settings from conf.yaml
+        if os.path.exists("conf.yaml"):
             try:
-                parser = YAMLParser(default_yaml_path)
-                st.session_state.fleet = parser.parse()
+                parser = get_conf_parser("conf.yaml")
+                st.session_state.fleet = parser.get_fleet()
+                st.session_state.cache_config = parser.get_cache_config()
             except Exception:
                 st.session_state.fleet = None
-        else:
-            st.session_state.fleet = None
-    if 'solution' not in st.session_state:
-        st.session_state.solution = None
-    if 'excel_path' not in st.session_state:
-        st.session_state.excel_path = None
-    if 'csv_path' not in st.session_state:
-        st.session_state.csv_path = None
-    if 'csv_summary_path' not in st.session_state:
-        st.session_state.csv_summary_path = None
-    if 'depot' not in st.session_state:
-        st.session_state.depot = None
-    # Multi-hub support
-    if 'hubs_config' not in st.session_state:
-        st.session_state.hubs_config = None  # MultiHubConfig object
-    if 'hub_routing_manager' not in st.session_state:
-        st.session_state.hub_routing_manager = None  # MultiHubRoutingManager
-    if 'map_html_cache' not in st.session_state:
-        st.session_state.map_html_cache = {}  # Cache map HTML by route filter
     if 'vehicle_config' not in st.session_state:
         # Auto-initialize from fleet if available
         if st.session_state.fleet is not None:
-            fleet = st.session_state.fleet
-            st.session_state.vehicle_config = {
-                'vehicles': [
-                    {
-                        'name': v.name,
-                        'capacity': v.capacity,
-                        'cost_per_km': v.cost_per_km,
-                        'fixed_count': count,
-                        'unlimited': unlimited
-                    }
-                    for v, count, unlimited in fleet.vehicle_types
-                ],
-                'routing': {
-                    'return_to_depot': fleet.return_to_depot,
-                    'priority_time_tolerance': fleet.priority_time_tolerance,
-                    'non_priority_time_tolerance': fleet.non_priority_time_tolerance,
-                    'multiple_trips': fleet.multiple_trips,
-                    'relax_time_windows': fleet.relax_time_windows,
-                    'time_window_relaxation_minutes': fleet.time_window_relaxation_minutes,
-                }
-            }
+            st.session_state.vehicle_config = _fleet_to_config_dict(st.session_state.fleet)
         else:
             st.session_state.vehicle_config = None
-    if 'config_modified' not in st.session_state:
-        st.session_state.config_modified = False  # Track if config has been modified from default
+
+    st.session_state.session_initialized = True
 
 
+@st.cache_resource(show_spinner=False)
 def get_depot_from_env():
-    """Load depot configuration from environment variables"""
+    """Load depot configuration from environment variables (read once per process)"""
     depot_lat = float(os.getenv("DEPOT_LATITUDE", "-6.2088"))
     depot_lon = float(os.getenv("DEPOT_LONGITUDE", "106.8456"))
     depot_name = os.getenv("DEPOT_NAME", "Segarloka Warehouse")
@@ -165,22 +159,258 @@ def get_depot_from_env():
 
 
 def get_hubs_from_yaml() -> MultiHubConfig:
-    """Load multi-hub configuration from conf.yaml"""
+    """Load multi-hub configuration from conf.yaml (parsed once per file change)"""
     try:
-        parser = YAMLParser("conf.yaml")
-        parser.parse()  # Load data first
-        hubs_config = parser.get_hubs_config()
-        return hubs_config
+        return get_conf_parser("conf.yaml").get_hubs_config()
     except Exception as e:
         st.warning(f"⚠️ Could not load hub configuration: {str(e)}")
         return MultiHubConfig(enabled=False)
 
 
+@st.cache_resource(show_spinner=False)
+def _load_conf_parser(yaml_path: str, mtime: float) -> YAMLParser:
+    """Parse a config file once per modification time (mtime is only a cache key)"""
+    parser = YAMLParser(yaml_path)
+    parser.parse()
+    return parser
+
+
+def get_conf_parser(yaml_path: str = "conf.yaml") -> YAMLParser:
+    """Get a parsed YAMLParser, re-parsing only when the file changes on disk"""
+    return _load_conf_parser(yaml_path, Path(yaml_path).stat().st_mtime)
+
+
+@st.cache_resource(show_spinner=False)
+def get_distance_calculator(cache_dir: str, cache_ttl_hours: int, enable_cache: bool) -> DistanceCalculator:
+    """Get a DistanceCalculator shared across reruns for the given cache settings"""
+    return DistanceCalculator(
+        cache_dir=cache_dir,
+        cache_ttl_hours=cache_ttl_hours,
+        enable_cache=enable_cache
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def get_hub_routing_summary(orders_key: str, hubs_key: str, _manager: MultiHubRoutingManager, _orders) -> dict:
+    """Summarize hub classification once per upload and hub setup (underscored args are not hashed)"""
+    return _manager.get_routing_summary(_orders)
+
+
+# How often the processing section refreshes its status while a solve runs
+SOLVE_POLL_SECONDS = 0.5
+
+
+def submit_solve(solver, optimization_strategy, time_limit) -> concurrent.futures.Future:
+    """
+    Start a solve on its own thread, off the Streamlit script thread.
+
+    Each solve gets a dedicated single-use worker, so sessions never queue behind
+    each other and a solve abandoned by a rerun only holds its own thread until done.
+    """
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="vrp-solve")
+    try:
+        return executor.submit(solver.solve, optimization_strategy=optimization_strategy, time_limit=time_limit)
+    finally:
+        executor.shutdown(wait=False)  # The worker thread exits once the solve finishes
+
+
+@st.cache_resource(show_spinner=False)
+def _load_map_visualizer(
+    _depot: Depot,
+    _hubs_config: MultiHubConfig,
+    depot_coordinates: tuple,
+    hub_key: tuple,
+    enable_road_routing: bool
+) -> "MapVisualizer":
+    """Build a MapVisualizer once per depot/hub setup (underscored args are not hashed)"""
+    from src.visualization.map_visualizer import MapVisualizer
+
+    return MapVisualizer(depot=_depot, hubs_config=_hubs_config, enable_road_routing=enable_road_routing)
+
+
+def get_map_visualizer(depot: Depot, hubs_config: MultiHubConfig, enable_road_routing: bool = True) -> "MapVisualizer":
+    """Get a cached MapVisualizer for the current depot and hub configuration"""
+    hub_key = tuple(
+        (hub_cfg.hub_id, tuple(hub_cfg.hub.coordinates)) for hub_cfg in hubs_config.hubs
+    ) if hubs_config else ()
+    return _load_map_visualizer(depot, hubs_config, tuple(depot.coordinates), hub_key, enable_road_routing)
+
+
+def compute_solution_key(solution) -> str:
+    """
+    Fingerprint everything a route map renders from a solution, so identical solutions share rendered maps.
+
+    Covers each route's vehicle, totals and timing, and each stop's full order
+    (popup fields) plus its timing and load; solution totals derive from these.
+    """
+    route_stops = [
+        (
+            tuple(vars(route.vehicle).values()),
+            route.source,
+            route.trip_number,
+            route.departure_time,
+            route.total_distance,
+            route.total_cost,
+            tuple(
+                (
+                    tuple(vars(stop.order).values()),
+                    stop.arrival_time,
+                    stop.departure_time,
+                    stop.distance_from_prev,
+                    stop.cumulative_weight,
+                    stop.sequence,
+                )
+                for stop in route.stops
+            ),
+        )
+        for route in solution.routes
+    ]
+    return hashlib.blake2b(repr(route_stops).encode(), digest_size=16).hexdigest()
+
+
+# Rendered maps kept on disk (under the distance cache directory) for warm restarts
+MAP_CACHE_SUBDIR = "maps"
+MAP_CACHE_MAX_FILES = 200
+# Bump when the visualizer output or the solution key changes, so older map files are never served
+MAP_CACHE_FORMAT_VERSION = 2
+
+
+def _prune_map_cache(map_cache_dir: Path):
+    """Delete the oldest cached map files beyond MAP_CACHE_MAX_FILES"""
+    map_files = sorted(map_cache_dir.glob("*.html"), key=lambda f: f.stat().st_mtime, reverse=True)
+    for map_file in map_files[MAP_CACHE_MAX_FILES:]:
+        map_file.unlink(missing_ok=True)
+
+
+@st.cache_resource(show_spinner="🛣️ Generating route map...", max_entries=64)
+def _render_route_map_html(
+    _solution,
+    _depot: Depot,
+    _hubs_config: MultiHubConfig,
+    solution_key: str,
+    route_idx: Optional[int],
+    depot_coordinates: tuple,
+    hub_key: tuple,
+    map_cache_dir: Optional[str] = None,
+    ttl_hours: int = 24
+) -> str:
+    """
+    Render a route map to raw HTML once per solution and route filter (underscored args are not hashed).
+
+    With a map_cache_dir, the HTML is also written to disk and reused after a restart
+    until it is older than ttl_hours, so an OSRM outage doesn't pin straight-line maps.
+    """
+    map_path = None
+    if map_cache_dir:
+        map_key = hashlib.blake2b(
+            repr((MAP_CACHE_FORMAT_VERSION, solution_key, route_idx, depot_coordinates, hub_key)).encode(),
+            digest_size=16
+        ).hexdigest()
+        map_path = Path(map_cache_dir) / f"{map_key}.html"
+        if map_path.exists() and time.time() - map_path.stat().st_mtime < ttl_hours * 3600:
+            return map_path.read_text(encoding="utf-8")
+
+    visualizer = get_map_visualizer(_depot, _hubs_config, enable_road_routing=True)
+    if route_idx is not None:
+        route_map = visualizer.create_single_route_map(_solution, route_idx, zoom_start=12)
+    else:
+        route_map = visualizer.create_map(_solution, zoom_start=12)
+    map_html = route_map.get_root().render()
+
+    if map_path is not None:
+        map_path.parent.mkdir(parents=True, exist_ok=True)
+        map_path.write_text(map_html, encoding="utf-8")
+        _prune_map_cache(map_path.parent)
+    return map_html
+
+
+def render_route_map_html(solution, depot: Depot, hubs_config: MultiHubConfig, route_idx: Optional[int]) -> str:
+    """Get the cached map HTML for a solution, either all routes or a single route"""
+    solution_key = st.session_state.solution_key or compute_solution_key(solution)
+    hub_key = tuple(
+        (hub_cfg.hub_id, tuple(hub_cfg.hub.coordinates)) for hub_cfg in hubs_config.hubs
+    ) if hubs_config else ()
+    cache_config = st.session_state.cache_config
+    map_cache_dir = (
+        str(Path(cache_config.get("directory", ".cache")) / MAP_CACHE_SUBDIR)
+        if cache_config.get("enabled", True) else None
+    )
+    return _render_route_map_html(
+        solution, depot, hubs_config, solution_key, route_idx, tuple(depot.coordinates), hub_key,
+        map_cache_dir, cache_config.get("ttl_hours", 24)
+    )
+
+
+HEADER_MARKDOWN = (
+    '<p class="main-header">🚚 Segarloka VRP Solver</p>\n\n'
+    '<p class="sub-header">Optimasi Routing Pengiriman Sayur dengan OR-Tools</p>\n\n'
+    '---'
+)
+
+
 def render_header():
-    """Render the application header"""
-    st.markdown('<p class="main-header">🚚 Segarloka VRP Solver</p>', unsafe_allow_html=True)
-    st.markdown('<p class="sub-header">Optimasi Routing Pengiriman Sayur dengan OR-Tools</p>', unsafe_allow_html=True)
-    st.markdown("---")
+    """Render the application header (title, subtitle and separator in one element)"""
+    st.markdown(HEADER_MARKDOWN, unsafe_allow_html=True)
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def parse_orders_csv(file_bytes: bytes):
+    """Parse uploaded order CSV bytes into (orders, 10-row preview, summary stats)"""
+    parser = CSVParser(io.BytesIO(file_bytes))
+    orders = parser.parse()
+    return orders, parser.df.head(10), parser.get_summary()
+
+
+def _on_config_change(target: dict, field: str, widget_key: str):
+    """Widget on_change callback: copy the widget's value into the vehicle config and mark it modified"""
+    target[field] = st.session_state[widget_key]
+    st.session_state.config_modified = True
+
+
+def _on_vehicle_editor_change():
+    """Vehicle editor on_change callback: mark the vehicle config modified"""
+    st.session_state.config_modified = True
+
+
+def _clear_config_widget_state():
+    """Forget config editor widget values, so widgets are re-initialized from vehicle_config"""
+    for key in list(st.session_state.keys()):
+        if key.startswith(CONFIG_WIDGET_PREFIXES):
+            del st.session_state[key]
+    st.session_state.vehicle_editor_data = None
+
+
+def _reset_vehicle_config():
+    """Reset to Defaults on_click callback: reload the fleet from conf.yaml (re-parsed only if the file changed)"""
+    try:
+        fleet = get_conf_parser("conf.yaml").get_fleet()
+        st.session_state.fleet = fleet
+        st.session_state.vehicle_config = _fleet_to_config_dict(fleet)
+        st.session_state.config_modified = False
+        _clear_config_widget_state()
+    except Exception as e:
+        st.session_state.config_reset_error = str(e)
+
+
+# Session state key prefixes of the vehicle/routing editor widgets
+CONFIG_WIDGET_PREFIXES = ("vehicle_editor", "routing_", "multi_trip_")
+
+# Vehicle editor columns, in vehicle_config field order
+VEHICLE_EDITOR_COLUMN_CONFIG = {
+    "name": st.column_config.TextColumn("Nama", required=True),
+    "capacity": st.column_config.NumberColumn(
+        "Capacity (kg)", min_value=1.0, max_value=10000.0, step=10.0, default=100.0, required=True
+    ),
+    "cost_per_km": st.column_config.NumberColumn(
+        "Rate (Rp/km)", min_value=0.0, max_value=1000000.0, step=100.0, default=2000.0, required=True
+    ),
+    "fixed_count": st.column_config.NumberColumn(
+        "Count", min_value=1, max_value=1000, step=1, default=1, required=True
+    ),
+    "unlimited": st.column_config.CheckboxColumn(
+        "Unlimited", default=False, help="Allow unlimited on-demand vehicles"
+    ),
+}
 
 
 def render_upload_section():
@@ -199,18 +429,18 @@ def render_upload_section():
 
         if csv_file is not None:
             try:
-                # Save to temporary file
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.csv', mode='wb') as tmp_file:
-                    tmp_file.write(csv_file.getvalue())
-                    tmp_path = tmp_file.name
-
-                # Parse CSV
-                parser = CSVParser(tmp_path)
-                orders = parser.parse()
-                st.session_state.orders = orders
-
-                # Clean up temp file
-                os.unlink(tmp_path)
+                # Reruns with the same upload reuse this session's orders; other
+                # sessions uploading the same file hit the parse cache
+                csv_bytes = csv_file.getvalue()
+                csv_hash = hashlib.blake2b(csv_bytes, digest_size=16).hexdigest()
+                upload = st.session_state.orders_upload
+                if upload is not None and upload[0] == csv_hash and st.session_state.orders is not None:
+                    orders = st.session_state.orders
+                    _, preview_df, summary = upload
+                else:
+                    orders, preview_df, summary = parse_orders_csv(csv_bytes)
+                    st.session_state.orders = orders
+                    st.session_state.orders_upload = (csv_hash, preview_df, summary)
 
                 # Show success message
                 st.markdown(
@@ -220,12 +450,11 @@ def render_upload_section():
 
                 # Preview data
                 st.subheader("Preview Data (10 rows pertama)")
-                df = pd.read_csv(io.StringIO(csv_file.getvalue().decode('utf-8')))
-                st.dataframe(df.head(10), width=1000)
+                st.dataframe(preview_df, width=1000)
 
                 # Show statistics
-                total_weight = sum(o.load_weight_in_kg for o in orders)
-                priority_count = sum(1 for o in orders if o.is_priority)
+                total_weight = summary["total_weight"]
+                priority_count = summary["priority_orders"]
 
                 col1_stat, col2_stat, col3_stat = st.columns(3)
                 with col1_stat:
@@ -241,6 +470,7 @@ def render_upload_section():
                     unsafe_allow_html=True
                 )
                 st.session_state.orders = None
+                st.session_state.orders_upload = None
 
     with col2:
         st.subheader("Vehicle Configuration")
@@ -255,102 +485,28 @@ def render_upload_section():
         # Vehicle types editor
         st.markdown("**Tipe Kendaraan**")
 
-        vehicles_to_remove = []
-        for idx, v_cfg in enumerate(config['vehicles']):
-            with st.container():
-                # Vehicle header with remove button
-                header_cols = st.columns([4, 1])
-                with header_cols[0]:
-                    # Editable vehicle name
-                    new_name = st.text_input(
-                        "Nama",
-                        value=v_cfg['name'],
-                        key=f"vehicle_name_{idx}",
-                        label_visibility="collapsed",
-                        placeholder="Vehicle name"
-                    )
-                    if new_name != v_cfg['name']:
-                        config['vehicles'][idx]['name'] = new_name
-                        st.session_state.config_modified = True
-
-                with header_cols[1]:
-                    if st.button("X", key=f"remove_vehicle_{idx}", help="Remove this vehicle type"):
-                        vehicles_to_remove.append(idx)
-
-                # Vehicle properties in columns
-                prop_cols = st.columns(4)
-
-                with prop_cols[0]:
-                    new_capacity = st.number_input(
-                        "Capacity (kg)",
-                        min_value=1.0,
-                        max_value=10000.0,
-                        value=float(v_cfg['capacity']),
-                        step=10.0,
-                        key=f"vehicle_capacity_{idx}"
-                    )
-                    if new_capacity != v_cfg['capacity']:
-                        config['vehicles'][idx]['capacity'] = new_capacity
-                        st.session_state.config_modified = True
-
-                with prop_cols[1]:
-                    new_rate = st.number_input(
-                        "Rate (Rp/km)",
-                        min_value=0.0,
-                        max_value=1000000.0,
-                        value=float(v_cfg['cost_per_km']),
-                        step=100.0,
-                        key=f"vehicle_rate_{idx}"
-                    )
-                    if new_rate != v_cfg['cost_per_km']:
-                        config['vehicles'][idx]['cost_per_km'] = new_rate
-                        st.session_state.config_modified = True
+        # The editor keeps its edits relative to this input table, so the input
+        # must stay fixed until the config is reset
+        if st.session_state.vehicle_editor_data is None:
+            st.session_state.vehicle_editor_data = pd.DataFrame(
+                config['vehicles'], columns=list(VEHICLE_EDITOR_COLUMN_CONFIG)
+            )
 
-                with prop_cols[2]:
-                    new_count = st.number_input(
-                        "Count",
-                        min_value=1,
-                        max_value=1000,
-                        value=int(v_cfg['fixed_count']),
-                        step=1,
-                        key=f"vehicle_count_{idx}"
-                    )
-                    if new_count != v_cfg['fixed_count']:
-                        config['vehicles'][idx]['fixed_count'] = new_count
-                        st.session_state.config_modified = True
-
-                with prop_cols[3]:
-                    new_unlimited = st.checkbox(
-                        "Unlimited",
-                        value=v_cfg.get('unlimited', False),
-                        key=f"vehicle_unlimited_{idx}",
-                        help="Allow unlimited on-demand vehicles"
-                    )
-                    if new_unlimited != v_cfg.get('unlimited', False):
-                        config['vehicles'][idx]['unlimited'] = new_unlimited
-                        st.session_state.config_modified = True
-
-                st.divider()
-
-        # Remove vehicles marked for deletion
-        if vehicles_to_remove:
-            for idx in sorted(vehicles_to_remove, reverse=True):
-                if len(config['vehicles']) > 1:  # Keep at least one vehicle
-                    config['vehicles'].pop(idx)
-                    st.session_state.config_modified = True
-            st.rerun()
-
-        # Add new vehicle button
-        if st.button("+ Add Vehicle Type", key="add_vehicle"):
-            config['vehicles'].append({
-                'name': f"New Vehicle {len(config['vehicles']) + 1}",
-                'capacity': 100.0,
-                'cost_per_km': 2000.0,
-                'fixed_count': 1,
-                'unlimited': False
-            })
-            st.session_state.config_modified = True
-            st.rerun()
+        edited_df = st.data_editor(
+            st.session_state.vehicle_editor_data,
+            num_rows="dynamic",
+            key="vehicle_editor",
+            column_config=VEHICLE_EDITOR_COLUMN_CONFIG,
+            hide_index=True,
+            width="stretch",
+            on_change=_on_vehicle_editor_change
+        )
+
+        vehicles = edited_df.dropna(subset=['name']).to_dict('records')
+        if vehicles:
+            config['vehicles'] = vehicles
+        else:
+            st.warning("At least one vehicle type is required")
 
         # Summary
         total_vehicles = sum(v['fixed_count'] for v in config['vehicles'])
@@ -360,30 +516,28 @@ def render_upload_section():
         st.markdown("---")
         st.markdown("**Routing Settings**")
 
-        routing = config.get('routing', {})
+        routing = config.setdefault('routing', {})
 
         routing_cols = st.columns(2)
 
         with routing_cols[0]:
-            new_return_depot = st.checkbox(
+            st.checkbox(
                 "Return to depot",
                 value=routing.get('return_to_depot', True),
                 key="routing_return_depot",
-                help="Vehicles must return to depot after deliveries"
+                help="Vehicles must return to depot after deliveries",
+                on_change=_on_config_change,
+                args=(routing, 'return_to_depot', "routing_return_depot")
             )
-            if new_return_depot != routing.get('return_to_depot', True):
-                routing['return_to_depot'] = new_return_depot
-                st.session_state.config_modified = True
 
             new_multiple_trips = st.checkbox(
                 "Multiple trips",
                 value=routing.get('multiple_trips', True),
                 key="routing_multiple_trips",
-                help="Allow vehicles to make multiple trips"
+                help="Allow vehicles to make multiple trips",
+                on_change=_on_config_change,
+                args=(routing, 'multiple_trips', "routing_multiple_trips")
             )
-            if new_multiple_trips != routing.get('multiple_trips', True):
-                routing['multiple_trips'] = new_multiple_trips
-                st.session_state.config_modified = True
 
             # Multi-trip detailed configuration
             if new_multiple_trips:
@@ -402,109 +556,95 @@ def render_upload_section():
                     "Enable multi-trip solver",
                     value=multi_trip.get('enabled', True),
                     key="multi_trip_enabled",
-                    help="Use clustering-based multi-trip solver"
+                    help="Use clustering-based multi-trip solver",
+                    on_change=_on_config_change,
+                    args=(multi_trip, 'enabled', "multi_trip_enabled")
                 )
-                if new_enabled != multi_trip.get('enabled', True):
-                    multi_trip['enabled'] = new_enabled
-                    st.session_state.config_modified = True
 
                 if new_enabled:
-                    new_buffer = st.slider(
+                    st.slider(
                         "Buffer time between trips (min)",
                         min_value=30,
                         max_value=120,
                         value=multi_trip.get('buffer_minutes', 60),
                         step=10,
                         key="multi_trip_buffer",
-                        help="Time for vehicle to return and reload"
+                        help="Time for vehicle to return and reload",
+                        on_change=_on_config_change,
+                        args=(multi_trip, 'buffer_minutes', "multi_trip_buffer")
                     )
-                    if new_buffer != multi_trip.get('buffer_minutes', 60):
-                        multi_trip['buffer_minutes'] = new_buffer
-                        st.session_state.config_modified = True
 
-                    clustering = multi_trip.get('clustering', {})
-                    new_gap = st.slider(
+                    clustering = multi_trip.setdefault('clustering', {})
+                    st.slider(
                         "Time window gap threshold (min)",
                         min_value=30,
                         max_value=180,
                         value=clustering.get('gap_threshold_minutes', 60),
                         step=15,
                         key="multi_trip_gap_threshold",
-                        help="Orders with gaps larger than this form separate clusters"
+                        help="Orders with gaps larger than this form separate clusters",
+                        on_change=_on_config_change,
+                        args=(clustering, 'gap_threshold_minutes', "multi_trip_gap_threshold")
                     )
-                    if new_gap != clustering.get('gap_threshold_minutes', 60):
-                        if 'clustering' not in multi_trip:
-                            multi_trip['clustering'] = {}
-                        multi_trip['clustering']['gap_threshold_minutes'] = new_gap
-                        st.session_state.config_modified = True
-
-                    vehicle_reuse = multi_trip.get('vehicle_reuse', {})
-                    new_max_trips = st.slider(
+
+                    vehicle_reuse = multi_trip.setdefault('vehicle_reuse', {})
+                    st.slider(
                         "Max trips per vehicle",
                         min_value=1,
                         max_value=5,
                         value=vehicle_reuse.get('max_trips_per_vehicle', 3),
                         key="multi_trip_max_trips",
-                        help="Maximum number of trips per physical vehicle"
+                        help="Maximum number of trips per physical vehicle",
+                        on_change=_on_config_change,
+                        args=(vehicle_reuse, 'max_trips_per_vehicle', "multi_trip_max_trips")
                     )
-                    if new_max_trips != vehicle_reuse.get('max_trips_per_vehicle', 3):
-                        if 'vehicle_reuse' not in multi_trip:
-                            multi_trip['vehicle_reuse'] = {}
-                        multi_trip['vehicle_reuse']['max_trips_per_vehicle'] = new_max_trips
-                        st.session_state.config_modified = True
 
         with routing_cols[1]:
-            new_priority_tol = st.number_input(
+            st.number_input(
                 "Priority time tolerance (min)",
                 min_value=0,
                 max_value=120,
                 value=routing.get('priority_time_tolerance', 0),
                 step=5,
                 key="routing_priority_tolerance",
-                help="Time flexibility for priority orders"
+                help="Time flexibility for priority orders",
+                on_change=_on_config_change,
+                args=(routing, 'priority_time_tolerance', "routing_priority_tolerance")
             )
-            if new_priority_tol != routing.get('priority_time_tolerance', 0):
-                routing['priority_time_tolerance'] = new_priority_tol
-                st.session_state.config_modified = True
 
-            new_non_priority_tol = st.number_input(
+            st.number_input(
                 "Non-priority tolerance (min)",
                 min_value=0,
                 max_value=180,
                 value=routing.get('non_priority_time_tolerance', 60),
                 step=5,
                 key="routing_non_priority_tolerance",
-                help="Time flexibility for non-priority orders"
+                help="Time flexibility for non-priority orders",
+                on_change=_on_config_change,
+                args=(routing, 'non_priority_time_tolerance', "routing_non_priority_tolerance")
             )
-            if new_non_priority_tol != routing.get('non_priority_time_tolerance', 60):
-                routing['non_priority_time_tolerance'] = new_non_priority_tol
-                st.session_state.config_modified = True
 
         # Relax time windows option
-        new_relax = st.checkbox(
+        st.checkbox(
             "Relax time windows",
             value=routing.get('relax_time_windows', False),
             key="routing_relax_windows",
-            help="Relax time window constraints if solver has difficulty"
+            help="Relax time window constraints if solver has difficulty",
+            on_change=_on_config_change,
+            args=(routing, 'relax_time_windows', "routing_relax_windows")
         )
-        if new_relax != routing.get('relax_time_windows', False):
-            routing['relax_time_windows'] = new_relax
-            st.session_state.config_modified = True
 
         if routing.get('relax_time_windows', False):
-            new_relax_min = st.number_input(
+            st.number_input(
                 "Relaxation (minutes)",
                 min_value=0,
                 max_value=120,
                 value=routing.get('time_window_relaxation_minutes', 15),
                 step=5,
-                key="routing_relax_minutes"
+                key="routing_relax_minutes",
+                on_change=_on_config_change,
+                args=(routing, 'time_window_relaxation_minutes', "routing_relax_minutes")
             )
-            if new_relax_min != routing.get('time_window_relaxation_minutes', 15):
-                routing['time_window_relaxation_minutes'] = new_relax_min
-                st.session_state.config_modified = True
-
-        config['routing'] = routing
 
         # Reset and status
         st.markdown("---")
@@ -515,17 +655,11 @@ def render_upload_section():
                 st.caption("Configuration modified")
 
         with action_cols[1]:
-            if st.button("Reset to Defaults", key="reset_config"):
-                # Reload from conf.yaml
-                try:
-                    parser = YAMLParser("conf.yaml")
-                    fleet = parser.parse()
-                    st.session_state.fleet = fleet
-                    st.session_state.vehicle_config = _fleet_to_config_dict(fleet)
-                    st.session_state.config_modified = False
-                    st.rerun()
-                except Exception as e:
-                    st.error(f"Failed to reset: {str(e)}")
+            # Resetting in on_click runs before the rerun renders the editor, so no st.rerun() is needed
+            st.button("Reset to Defaults", key="reset_config", on_click=_reset_vehicle_config)
+            reset_error = st.session_state.pop('config_reset_error', None)
+            if reset_error:
+                st.error(f"Failed to reset: {reset_error}")
 
 
 def render_configuration_section():
@@ -537,33 +671,37 @@ def render_configuration_section():
     with col1:
         st.subheader("Strategi Optimasi")
 
-        optimization_strategy = st.radio(
-            "Pilih strategi optimasi:",
-            options=["minimize_vehicles", "minimize_cost", "balanced"],
-            format_func=lambda x: {
-                "minimize_vehicles": "⚙️ Minimize Vehicles - Kurangi jumlah kendaraan (route lebih panjang)",
-                "minimize_cost": "💰 Minimize Cost - Kurangi total biaya (lebih banyak kendaraan)",
-                "balanced": "⚖️ Balanced - Seimbang antara jumlah kendaraan dan biaya"
-            }[x],
-            index=2  # Default to balanced
-        )
+        # A form batches strategy/time limit edits into one rerun on "Terapkan"
+        with st.form("routing_strategy_form", border=False):
+            optimization_strategy = st.radio(
+                "Pilih strategi optimasi:",
+                options=["minimize_vehicles", "minimize_cost", "balanced"],
+                format_func=lambda x: {
+                    "minimize_vehicles": "⚙️ Minimize Vehicles - Kurangi jumlah kendaraan (route lebih panjang)",
+                    "minimize_cost": "💰 Minimize Cost - Kurangi total biaya (lebih banyak kendaraan)",
+                    "balanced": "⚖️ Balanced - Seimbang antara jumlah kendaraan dan biaya"
+                }[x],
+                index=2  # Default to balanced
+            )
 
-        st.markdown(
-            '<div class="info-box"><strong>ℹ️ Rekomendasi:</strong><br>'
-            '• Gunakan <strong>Minimize Vehicles</strong> jika driver terbatas<br>'
-            '• Gunakan <strong>Minimize Cost</strong> jika driver banyak tersedia<br>'
-            '• Gunakan <strong>Balanced</strong> untuk hasil optimal umum</div>',
-            unsafe_allow_html=True
-        )
+            st.markdown(
+                '<div class="info-box"><strong>ℹ️ Rekomendasi:</strong><br>'
+                '• Gunakan <strong>Minimize Vehicles</strong> jika driver terbatas<br>'
+                '• Gunakan <strong>Minimize Cost</strong> jika driver banyak tersedia<br>'
+                '• Gunakan <strong>Balanced</strong> untuk hasil optimal umum</div>',
+                unsafe_allow_html=True
+            )
 
-        time_limit = st.slider(
-            "Time Limit (detik)",
-            min_value=60,
-            max_value=600,
-            value=60,
-            step=30,
-            help="Maksimal waktu untuk solver mencari solusi optimal"
-        )
+            time_limit = st.slider(
+                "Time Limit (detik)",
+                min_value=60,
+                max_value=600,
+                value=60,
+                step=30,
+                help="Maksimal waktu untuk solver mencari solusi optimal"
+            )
+
+            st.form_submit_button("Terapkan")
 
     with col2:
         st.subheader("Lokasi Depot & Hubs")
@@ -571,9 +709,11 @@ def render_configuration_section():
         depot = get_depot_from_env()
         st.session_state.depot = depot
 
-        st.write(f"**Depot - Nama:** {depot.name}")
-        st.write(f"**Depot - Alamat:** {depot.address}")
-        st.write(f"**Depot - Koordinat:** {depot.coordinates[0]:.6f}, {depot.coordinates[1]:.6f}")
+        st.markdown(
+            f"**Depot - Nama:** {depot.name}  \n"
+            f"**Depot - Alamat:** {depot.address}  \n"
+            f"**Depot - Koordinat:** {depot.coordinates[0]:.6f}, {depot.coordinates[1]:.6f}"
+        )
 
         # Load and display multi-hub configuration
         hubs_config = get_hubs_from_yaml()
@@ -595,15 +735,19 @@ def render_configuration_section():
             # Display each hub
             for hub_cfg in hubs_config.hubs:
                 with st.expander(f"📦 {hub_cfg.hub.name} ({hub_cfg.hub_id})"):
-                    st.write(f"**Alamat:** {hub_cfg.hub.address}")
-                    st.write(f"**Koordinat:** {hub_cfg.hub.coordinates[0]:.6f}, {hub_cfg.hub.coordinates[1]:.6f}")
-                    st.write(f"**Zones:** {', '.join(hub_cfg.zones_via_hub) if hub_cfg.zones_via_hub else 'None'}")
+                    st.markdown(
+                        f"**Alamat:** {hub_cfg.hub.address}  \n"
+                        f"**Koordinat:** {hub_cfg.hub.coordinates[0]:.6f}, {hub_cfg.hub.coordinates[1]:.6f}  \n"
+                        f"**Zones:** {', '.join(hub_cfg.zones_via_hub) if hub_cfg.zones_via_hub else 'None'}"
+                    )
 
             # Schedule info
-            st.write(f"**Blind Van Depart:** {hubs_config.blind_van_departure} min")
-            st.write(f"**Blind Van Arrival:** {hubs_config.blind_van_arrival} min")
-            st.write(f"**Motor Start:** {hubs_config.motor_start_time} min")
-            st.write(f"**Unassigned Zone Behavior:** {hubs_config.unassigned_zone_behavior}")
+            st.markdown(
+                f"**Blind Van Depart:** {hubs_config.blind_van_departure} min  \n"
+                f"**Blind Van Arrival:** {hubs_config.blind_van_arrival} min  \n"
+                f"**Motor Start:** {hubs_config.motor_start_time} min  \n"
+                f"**Unassigned Zone Behavior:** {hubs_config.unassigned_zone_behavior}"
+            )
 
     return optimization_strategy, time_limit
 
@@ -679,13 +823,29 @@ def apply_config_overrides(fleet: VehicleFleet) -> VehicleFleet:
     Apply user configuration overrides to create a modified fleet.
 
     Returns:
-        New VehicleFleet with applied overrides from vehicle_config
+        New VehicleFleet with applied overrides from vehicle_config,
+        or the given fleet itself when the config has not been edited
     """
-    if st.session_state.vehicle_config is not None:
+    # An unedited config mirrors the loaded fleet: keep its Vehicle objects
+    if st.session_state.vehicle_config is not None and st.session_state.config_modified:
         return _config_dict_to_fleet(st.session_state.vehicle_config)
     return fleet
 
 
+def compute_solve_key(orders, depot: Depot, hubs_config: MultiHubConfig, optimization_strategy, time_limit) -> str:
+    """Fingerprint everything a routing run depends on, to detect an unchanged re-run"""
+    solve_inputs = (
+        [tuple(vars(order).values()) for order in orders],
+        st.session_state.vehicle_config,
+        (depot.name, tuple(depot.coordinates)),
+        repr(hubs_config),
+        get_conf_parser("conf.yaml").get_config(),
+        optimization_strategy,
+        time_limit,
+    )
+    return hashlib.blake2b(repr(solve_inputs).encode(), digest_size=16).hexdigest()
+
+
 def render_processing_section(optimization_strategy, time_limit):
     """Render the processing section with generate button"""
     st.header("🔄 3. Generate Routes")
@@ -703,14 +863,22 @@ def render_processing_section(optimization_strategy, time_limit):
 
     # Generate button
     if st.button("🚀 Generate Routing Optimal", type="primary", width="stretch"):
-        try:
-            # Progress tracking
-            progress_bar = st.progress(0)
-            status_text = st.empty()
+        solve_key = compute_solve_key(
+            st.session_state.orders,
+            st.session_state.depot,
+            st.session_state.hubs_config,
+            optimization_strategy,
+            time_limit
+        )
+        if st.session_state.solution is not None and solve_key == st.session_state.last_solve_key:
+            st.info("ℹ️ Orders dan konfigurasi tidak berubah sejak generate terakhir — menampilkan hasil sebelumnya.")
+            return
 
+        # One status element whose label is updated in place for every step
+        status = st.status("📋 Mempersiapkan data...", expanded=False)
+
+        try:
             # Step 1: Prepare data
-            status_text.text("📋 Mempersiapkan data...")
-            progress_bar.progress(10)
 
             orders = st.session_state.orders
             fleet = st.session_state.fleet
@@ -727,7 +895,12 @@ def render_processing_section(optimization_strategy, time_limit):
             # Display hub routing summary
             if not hubs_config.is_zero_hub_mode:
                 try:
-                    summary = hub_routing_manager.get_routing_summary(orders)
+                    summary = get_hub_routing_summary(
+                        st.session_state.orders_upload[0],
+                        repr((depot, hubs_config)),
+                        hub_routing_manager,
+                        orders
+                    )
                     with st.expander("📊 Multi-Hub Routing Summary"):
                         col_summary1, col_summary2, col_summary3 = st.columns(3)
                         with col_summary1:
@@ -763,41 +936,40 @@ def render_processing_section(optimization_strategy, time_limit):
                     locations.append(hub_cfg.hub)
 
             # Add all customer locations
-            locations.extend([
-                Location(o.display_name, o.coordinates, o.alamat)
-                for o in orders
-            ])
+            locations.extend(map(Location.from_order, orders))
 
             # Step 2: Calculate distance matrix with cache
-            status_text.text("🗺️ Menghitung distance matrix via OSRM API...")
-            progress_bar.progress(20)
+            status.update(label="🗺️ Menghitung distance matrix via OSRM API...")
 
-            # Get cache config from YAML
-            parser = YAMLParser("conf.yaml")
-            parser.parse()  # Load data
-            cache_config = parser.get_cache_config()
+            # Cache config was read from conf.yaml when the session started
+            cache_config = st.session_state.cache_config
 
-            calculator = DistanceCalculator(
+            calculator = get_distance_calculator(
                 cache_dir=cache_config.get("directory", ".cache"),
                 cache_ttl_hours=cache_config.get("ttl_hours", 24),
                 enable_cache=cache_config.get("enabled", True)
             )
 
-            with st.spinner("Fetching distances from OSRM (with cache)..."):
-                distance_matrix, duration_matrix = calculator.calculate_matrix(locations)
-
-            # Show cache statistics
-            cache_stats = calculator.get_cache_stats()
-            if cache_stats["cache_hits"] > 0:
-                status_text.text(f"✅ Distance matrix loaded (🔥 cache hit! Saved {cache_stats['api_calls']} API calls)")
+            # Fast path: matrix already on disk, no API call or stats needed
+            cached_matrices = calculator.load_cached_matrix(locations)
+            if cached_matrices is not None:
+                distance_matrix, duration_matrix = cached_matrices
+                status.write(f"✅ Distance matrix loaded from cache ({len(locations)}x{len(locations)} locations)")
             else:
-                status_text.text(f"✅ Distance matrix calculated ({len(locations)}x{len(locations)} locations, cached for reuse)")
+                # Stats for this run only: the calculator is shared with other sessions
+                matrix_stats = {}
+                distance_matrix, duration_matrix = calculator.calculate_matrix(
+                    locations, force_refresh=True, stats=matrix_stats
+                )
 
-            progress_bar.progress(40)
+                if matrix_stats["haversine_fallbacks"] > 0:
+                    status.write(f"⚠️ Distance matrix estimated with straight-line distances ({len(locations)}x{len(locations)} locations)")
+                else:
+                    cache_note = ", cached for reuse" if calculator.enable_cache else ""
+                    status.write(f"✅ Distance matrix calculated ({len(locations)}x{len(locations)} locations, {matrix_stats['api_calls']} API calls{cache_note})")
 
             # Step 3: Solve VRP using Multi-Hub Routing
-            status_text.text(f"🧮 Solving VRP dengan strategi: {optimization_strategy}...")
-            progress_bar.progress(50)
+            status.update(label=f"🧮 Solving VRP dengan strategi: {optimization_strategy} (max {time_limit}s)...")
 
             if hubs_config.is_zero_hub_mode:
                 st.info("📦 Zero Hub Mode: All orders routed directly from DEPOT")
@@ -806,7 +978,9 @@ def render_processing_section(optimization_strategy, time_limit):
                 st.info(f"🎯 Multi-Hub Routing: Blind Van → [{hub_names}], Motors from each hub/DEPOT")
 
             # Load solver configuration
-            config = parser.get_config()
+            config = get_conf_parser("conf.yaml").get_config()
+
+            from src.solver.two_tier_vrp_solver import MultiHubVRPSolver
 
             solver = MultiHubVRPSolver(
                 orders=orders,
@@ -819,56 +993,74 @@ def render_processing_section(optimization_strategy, time_limit):
                 config=config
             )
 
-            with st.spinner(f"Optimizing routes (max {time_limit}s)..."):
-                solution = solver.solve(
-                    optimization_strategy=optimization_strategy,
-                    time_limit=time_limit
+            # Solve off the script thread so the status label can show elapsed time
+            solve_future = submit_solve(solver, optimization_strategy, time_limit)
+            solve_started = None
+            while not solve_future.done():
+                time.sleep(SOLVE_POLL_SECONDS)
+                # Elapsed time counts from when the solve is running, not when it was submitted
+                if solve_started is None:
+                    if not solve_future.running():
+                        continue
+                    solve_started = time.time()
+                status.update(
+                    label=f"🧮 Solving VRP dengan strategi: {optimization_strategy} "
+                          f"({time.time() - solve_started:.0f}s / max {time_limit}s)..."
                 )
+            solution = solve_future.result()
 
             st.session_state.solution = solution
+            st.session_state.solution_key = compute_solution_key(solution)
 
-            # Clear map HTML cache for new solution
-            st.session_state.map_html_cache = {}
+            # Clear route table for new solution (maps are cached by solution_key)
+            st.session_state.route_df = None
 
-            status_text.text(f"✅ Solusi ditemukan! {len(solution.routes)} routes generated")
-            progress_bar.progress(70)
+            status.write(f"✅ Solusi ditemukan! {len(solution.routes)} routes generated")
 
             # Step 4: Generate Excel and CSV
-            status_text.text("📊 Generating Excel and CSV outputs...")
-            progress_bar.progress(80)
+            status.update(label="📊 Generating Excel and CSV outputs...")
 
             # Ensure results directory exists
             results_dir = Path("results")
             results_dir.mkdir(exist_ok=True)
 
-            # Generate Excel
-            excel_generator = ExcelGenerator(depot=depot)
-            excel_path = excel_generator.generate(
-                solution=solution,
-                output_dir=str(results_dir)
-            )
-            st.session_state.excel_path = excel_path
+            from src.output.excel_generator import ExcelGenerator
+            from src.output.csv_generator import CSVGenerator
 
-            # Generate CSV with same timestamp
+            # The three files are independent, so write them concurrently
             timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+            excel_generator = ExcelGenerator(depot=depot)
             csv_generator = CSVGenerator(depot=depot, hubs_config=hubs_config)
-            csv_path = csv_generator.generate(
-                solution=solution,
-                output_dir=str(results_dir),
-                filename=f"routing_result_{timestamp}"
-            )
-            st.session_state.csv_path = csv_path
+            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+                excel_future = executor.submit(
+                    excel_generator.generate,
+                    solution=solution,
+                    output_dir=str(results_dir)
+                )
+                csv_future = executor.submit(
+                    csv_generator.generate,
+                    solution=solution,
+                    output_dir=str(results_dir),
+                    filename=f"routing_result_{timestamp}"
+                )
+                csv_summary_future = executor.submit(
+                    csv_generator.generate_summary_csv,
+                    solution=solution,
+                    output_dir=str(results_dir),
+                    filename=f"routing_summary_{timestamp}"
+                )
+                excel_path = excel_future.result()
+                csv_path = csv_future.result()
+                csv_summary_path = csv_summary_future.result()
 
-            # Generate CSV summary
-            csv_summary_path = csv_generator.generate_summary_csv(
-                solution=solution,
-                output_dir=str(results_dir),
-                filename=f"routing_summary_{timestamp}"
-            )
+            st.session_state.excel_path = excel_path
+            st.session_state.csv_path = csv_path
             st.session_state.csv_summary_path = csv_summary_path
 
-            status_text.text("✅ Excel and CSV files berhasil dibuat!")
-            progress_bar.progress(100)
+            # Outputs are complete; an unchanged re-run can reuse this solution
+            st.session_state.last_solve_key = solve_key
+
+            status.update(label="✅ Excel and CSV files berhasil dibuat!", state="complete")
 
             # Show success message
             st.markdown(
@@ -882,6 +1074,7 @@ def render_processing_section(optimization_strategy, time_limit):
             )
 
         except Exception as e:
+            status.update(label="❌ Generating routes gagal", state="error")
             st.markdown(
                 f'<div class="error-box">'
                 f'<strong>❌ Error saat generating routes:</strong><br>'
@@ -889,13 +1082,127 @@ def render_processing_section(optimization_strategy, time_limit):
                 '</div>',
                 unsafe_allow_html=True
             )
-            import traceback
-            with st.expander("🔍 Detail Error (untuk debugging)"):
-                st.code(traceback.format_exc())
+            # Stack traces are only formatted when Debug Mode is on in the sidebar
+            if st.session_state.get("debug_mode", False):
+                import traceback
+                with st.expander("🔍 Detail Error (untuk debugging)"):
+                    st.code(traceback.format_exc())
+
+
+# Display formatting for the route details table (applied client-side by st.dataframe)
+ROUTE_TABLE_COLUMN_CONFIG = {
+    "Weight (kg)": st.column_config.NumberColumn(format="%.1f"),
+    "Cumulative Weight (kg)": st.column_config.NumberColumn(format="%.1f"),
+    "Distance (km)": st.column_config.NumberColumn(format="%.2f"),
+}
+
+# Display formatting for the unassigned orders table
+UNASSIGNED_TABLE_COLUMN_CONFIG = {
+    "Weight (kg)": st.column_config.NumberColumn(format="%.1f"),
+}
+
+
+def build_route_dataframe(solution, depot: Depot, hubs_config: MultiHubConfig) -> pd.DataFrame:
+    """Build the route details table, one row per delivery stop"""
+    columns = {
+        name: [] for name in (
+            "Source", "Trip #", "From", "To", "Vehicle", "Sequence", "Location",
+            "Customer", "Address", "City/Zone", "Delivery Time", "Arrival", "Departure",
+            "Weight (kg)", "Cumulative Weight (kg)", "Distance (km)", "Priority",
+        )
+    }
 
+    for route in solution.routes:
+        # Set starting location based on route source
+        if route.source != "DEPOT" and hubs_config:
+            hub_config = hubs_config.get_hub_by_id(route.source)
+            previous_location = hub_config.hub.name if hub_config else depot.name
+        else:
+            previous_location = depot.name
 
+        for stop in route.stops:
+            order = stop.order
+            if order is None:  # Skip depot
+                continue
+
+            # HUB consolidation stops are shown as hubs, not customers
+            is_hub = order.sale_order_id == "HUB_CONSOLIDATION"
+            current_location = order.display_name
+
+            columns["Source"].append(route.source)
+            columns["Trip #"].append(route.trip_number)
+            columns["From"].append(previous_location)
+            columns["To"].append(current_location)
+            columns["Vehicle"].append(route.vehicle.name)
+            columns["Sequence"].append(stop.sequence + 1)
+            columns["Location"].append("📦 HUB" if is_hub else "🏠 Customer")
+            columns["Customer"].append(current_location)
+            columns["Address"].append(order.alamat)
+            columns["City/Zone"].append(order.kota)
+            columns["Delivery Time"].append(order.delivery_time)
+            columns["Arrival"].append(stop.arrival_time_str)
+            columns["Departure"].append(stop.departure_time_str)
+            columns["Weight (kg)"].append(order.load_weight_in_kg)
+            columns["Cumulative Weight (kg)"].append(stop.cumulative_weight)
+            columns["Distance (km)"].append(stop.distance_from_prev)
+            columns["Priority"].append("✅" if order.is_priority else "")
+
+            # Update previous location for next iteration
+            previous_location = current_location
+
+    # Numbers stay numeric; formatting is left to the table renderer (ROUTE_TABLE_COLUMN_CONFIG).
+    # Text columns are Arrow-backed so Streamlit can serialize them without object conversion.
+    df = pd.DataFrame(columns)
+    for column in (
+        "Source", "From", "To", "Location", "Customer", "Address", "City/Zone",
+        "Delivery Time", "Arrival", "Departure", "Priority",
+    ):
+        df[column] = df[column].astype("string[pyarrow]")
+    df["Vehicle"] = df["Vehicle"].astype("category")
+    for column in ("Weight (kg)", "Cumulative Weight (kg)", "Distance (km)"):
+        df[column] = df[column].astype("float64")
+    return df
+
+
+@st.fragment
+def render_route_table(df_routes: pd.DataFrame, routes_by_vehicle: dict, vehicle_options: list):
+    """Render the vehicle-filtered route table (a nested fragment: filtering doesn't rerun the map)"""
+    selected_vehicle = st.selectbox(
+        "🚚 Filter by Vehicle",
+        options=["All"] + vehicle_options,
+        help="Select a vehicle to see its routes, or 'All' to see all routes"
+    )
+
+    if selected_vehicle != "All":
+        df_display = st.session_state.route_df_by_vehicle.get(selected_vehicle, df_routes.iloc[:0])
+    else:
+        df_display = df_routes
+
+    # Show warning if no routes for selected vehicle
+    if len(df_display) == 0:
+        st.warning(f"No routes found for {selected_vehicle}")
+    else:
+        st.dataframe(df_display, width="stretch", height=400, column_config=ROUTE_TABLE_COLUMN_CONFIG)
+
+        # Show statistics for selected vehicle
+        if selected_vehicle != "All":
+            vehicle_route = routes_by_vehicle.get(selected_vehicle)
+            if vehicle_route:
+                route = vehicle_route[0]
+                col_stat1, col_stat2, col_stat3, col_stat4 = st.columns(4)
+                with col_stat1:
+                    st.metric("Stops", len(route.stops))
+                with col_stat2:
+                    st.metric("Distance (km)", f"{route.total_distance:.1f}")
+                with col_stat3:
+                    st.metric("Weight (kg)", f"{route.total_weight:.1f}")
+                with col_stat4:
+                    st.metric("Cost", f"Rp {route.total_cost:,.0f}")
+
+
+@st.fragment
 def render_results_section():
-    """Render the results section"""
+    """Render the results section (a fragment: its filters and buttons rerun only this section)"""
     st.header("📊 4. Hasil Routing")
 
     if st.session_state.solution is None:
@@ -944,18 +1251,15 @@ def render_results_section():
             f"This might be due to tight time windows, capacity limits, or unreachable locations."
         )
 
-        unassigned_data = []
-        for order in solution.unassigned_orders:
-            unassigned_data.append({
-                "Customer": order.display_name,
-                "Address": order.alamat,
-                "Delivery Time": order.delivery_time,
-                "Weight (kg)": order.load_weight_in_kg,
-                "Priority": "✅" if order.is_priority else ""
-            })
-        
-        df_unassigned = pd.DataFrame(unassigned_data)
-        st.dataframe(df_unassigned, width=1000)
+        unassigned = solution.unassigned_orders
+        df_unassigned = pd.DataFrame({
+            "Customer": [order.display_name for order in unassigned],
+            "Address": [order.alamat for order in unassigned],
+            "Delivery Time": [order.delivery_time for order in unassigned],
+            "Weight (kg)": [order.load_weight_in_kg for order in unassigned],
+            "Priority": ["✅" if order.is_priority else "" for order in unassigned],
+        })
+        st.dataframe(df_unassigned, width=1000, column_config=UNASSIGNED_TABLE_COLUMN_CONFIG)
 
     st.markdown("---")
 
@@ -1004,54 +1308,11 @@ def render_results_section():
         depot = st.session_state.depot
         hubs_config = st.session_state.hubs_config
 
-        # Create cache key based on selected route
-        cache_key = f"route_{selected_route_idx}" if selected_route_idx is not None else "all_routes"
-
-        # Check if map HTML is already cached
-        if cache_key in st.session_state.map_html_cache:
-            # Use cached HTML (instant display, no regeneration)
-            map_html = st.session_state.map_html_cache[cache_key]
-            st.success("✅ Map loaded from cache (instant)")
-            components.html(map_html, height=600, scrolling=True)
-        else:
-            # Generate map (first time for this filter)
-            visualizer = MapVisualizer(
-                depot=depot,
-                hubs_config=hubs_config,  # Pass multi-hub config to visualizer
-                enable_road_routing=True  # Use actual road paths
-            )
-
-            if visualizer.enable_road_routing:
-                with st.spinner("🛣️ Generating map with actual road paths (this will be cached)..."):
-                    if selected_route_idx is not None:
-                        # Single route view
-                        route_map = visualizer.create_single_route_map(
-                            solution,
-                            selected_route_idx,
-                            zoom_start=12
-                        )
-                    else:
-                        # All routes view
-                        route_map = visualizer.create_map(solution, zoom_start=12)
-                st.success("✅ Map generated and cached for instant future access!")
-            else:
-                # No spinner needed for straight lines
-                if selected_route_idx is not None:
-                    route_map = visualizer.create_single_route_map(
-                        solution,
-                        selected_route_idx,
-                        zoom_start=12
-                    )
-                else:
-                    route_map = visualizer.create_map(solution, zoom_start=12)
-                st.warning("⚠️ Using straight-line paths (OSRM URL not configured for road routing)")
-
-            # Save map as HTML and cache it
-            map_html = route_map._repr_html_()
-            st.session_state.map_html_cache[cache_key] = map_html
-
-            # Display the map
-            components.html(map_html, height=600, scrolling=True)
+        # Map HTML is cached per (solution, route filter): switching filters back is instant
+        map_html = render_route_map_html(solution, depot, hubs_config, selected_route_idx)
+        if not get_map_visualizer(depot, hubs_config, enable_road_routing=True).enable_road_routing:
+            st.warning("⚠️ Using straight-line paths (OSRM URL not configured for road routing)")
+        components.html(map_html, height=600)
 
         # Option to download map as HTML
         col_map1, col_map2 = st.columns([3, 1])
@@ -1067,28 +1328,15 @@ def render_results_section():
                     map_filename = f"route_map_all_{timestamp}.html"
                 map_path = results_dir / map_filename
 
-                # Use cached HTML if available, otherwise generate
-                if cache_key in st.session_state.map_html_cache:
-                    map_html_content = st.session_state.map_html_cache[cache_key]
-                    with open(map_path, 'w', encoding='utf-8') as f:
-                        f.write(map_html_content)
-                else:
-                    # Fallback: generate map if not cached (shouldn't happen)
-                    visualizer = MapVisualizer(depot=depot, hubs_config=hubs_config, enable_road_routing=True)
-                    if selected_route_idx is not None:
-                        visualizer.save_single_route_map(solution, selected_route_idx, str(map_path))
-                    else:
-                        visualizer.save_map(solution, str(map_path))
-
-                    with open(map_path, 'r', encoding='utf-8') as f:
-                        map_html_content = f.read()
+                with open(map_path, 'w', encoding='utf-8') as f:
+                    f.write(map_html)
 
                 st.success(f"✅ Map saved: {map_filename}")
 
                 # Download button
                 st.download_button(
                     label="📥 Download Map HTML",
-                    data=map_html_content,
+                    data=map_html,
                     file_name=map_filename,
                     mime="text/html",
                     width="stretch"
@@ -1112,106 +1360,35 @@ def render_results_section():
 
     except Exception as e:
         st.error(f"❌ Error creating map: {str(e)}")
-        import traceback
-        with st.expander("🔍 Debug info"):
-            st.code(traceback.format_exc())
+        if st.session_state.get("debug_mode", False):
+            import traceback
+            with st.expander("🔍 Debug info"):
+                st.code(traceback.format_exc())
 
     st.markdown("---")
 
     # Route preview
     st.subheader("📋 Route Details Table")
 
-    # Create DataFrame for display
-    route_data = []
-    hubs_config = st.session_state.hubs_config
-    for route in solution.routes:
-        # Set starting location based on route source
-        if route.source != "DEPOT" and hubs_config:
-            hub_config = hubs_config.get_hub_by_id(route.source)
-            previous_location = hub_config.hub.name if hub_config else depot.name
-        else:
-            previous_location = depot.name
-
-        for stop in route.stops:
-            if stop.order is not None:  # Skip depot
-                # Check if this is a HUB consolidation stop
-                is_hub = stop.order.sale_order_id == "HUB_CONSOLIDATION"
-
-                # Current location name
-                current_location = stop.order.display_name
-
-                route_data.append({
-                    "Source": route.source,
-                    "Trip #": route.trip_number,
-                    "From": previous_location,
-                    "To": current_location,
-                    "Vehicle": route.vehicle.name,
-                    "Sequence": stop.sequence + 1,
-                    "Location": "📦 HUB" if is_hub else "🏠 Customer",
-                    "Customer": stop.order.display_name if stop.order else "-",
-                    "Address": stop.order.alamat if stop.order else "-",
-                    "City/Zone": stop.order.kota if stop.order else "-",
-                    "Delivery Time": stop.order.delivery_time if stop.order else "-",
-                    "Arrival": stop.arrival_time_str,
-                    "Departure": stop.departure_time_str,
-                    "Weight (kg)": f"{stop.order.load_weight_in_kg:.1f}" if stop.order else "-",
-                    "Cumulative Weight (kg)": f"{stop.cumulative_weight:.1f}",
-                    "Distance (km)": f"{stop.distance_from_prev:.2f}",
-                    "Priority": "✅" if (stop.order and stop.order.is_priority) else ""
-                })
-
-                # Update previous location for next iteration
-                previous_location = current_location
-
-    df_routes = pd.DataFrame(route_data)
+    # Route table is built once per solution and reused across reruns
+    if st.session_state.route_df is None:
+        st.session_state.route_df = build_route_dataframe(solution, depot, st.session_state.hubs_config)
+        st.session_state.route_df_by_vehicle = dict(
+            iter(st.session_state.route_df.groupby("Vehicle", sort=False, observed=True))
+        )
+    df_routes = st.session_state.route_df
 
     # Filter by vehicle
-    # Get unique vehicles from routes, with special handling for Blind Van
-    vehicle_options = []
+    # Group routes by vehicle name once; the stable sort only moves Blind Van to the front
+    routes_by_vehicle = {}
     for route in solution.routes:
-        vehicle_name = route.vehicle.name
-        if vehicle_name not in vehicle_options:
-            vehicle_options.append(vehicle_name)
-
-    # Sort to put Blind Van first if present
-    if "Blind Van" in vehicle_options:
-        vehicle_options.remove("Blind Van")
-        vehicle_options.insert(0, "Blind Van")
-
-    selected_vehicle = st.selectbox(
-        "🚚 Filter by Vehicle",
-        options=["All"] + vehicle_options,
-        help="Select a vehicle to see its routes, or 'All' to see all routes"
-    )
+        routes_by_vehicle.setdefault(route.vehicle.name, []).append(route)
+    vehicle_options = sorted(routes_by_vehicle, key=lambda name: name != "Blind Van")
 
-    if selected_vehicle != "All":
-        df_display = df_routes[df_routes["Vehicle"] == selected_vehicle]
-    else:
-        df_display = df_routes
-
-    # Show warning if no routes for selected vehicle
-    if len(df_display) == 0:
-        st.warning(f"No routes found for {selected_vehicle}")
-    else:
-        st.dataframe(df_display, width="stretch", height=400)
-
-        # Show statistics for selected vehicle
-        if selected_vehicle != "All":
-            vehicle_route = [r for r in solution.routes if r.vehicle.name == selected_vehicle]
-            if vehicle_route:
-                route = vehicle_route[0]
-                col_stat1, col_stat2, col_stat3, col_stat4 = st.columns(4)
-                with col_stat1:
-                    st.metric("Stops", len(route.stops))
-                with col_stat2:
-                    st.metric("Distance (km)", f"{route.total_distance:.1f}")
-                with col_stat3:
-                    st.metric("Weight (kg)", f"{route.total_weight:.1f}")
-                with col_stat4:
-                    st.metric("Cost", f"Rp {route.total_cost:,.0f}")
+    render_route_table(df_routes, routes_by_vehicle, vehicle_options)
 
     # Note about Blind Van visibility
-    if "Blind Van" not in [r.vehicle.name for r in solution.routes]:
+    if "Blind Van" not in vehicle_options:
         if st.session_state.hubs_config and not st.session_state.hubs_config.is_zero_hub_mode:
             st.info(
                 "ℹ️ **Blind Van Note:** Blind Van consolidation route will appear when:\n"
@@ -1227,9 +1404,7 @@ def render_results_section():
 
         # Get all zones that route via any hub
         all_hub_zones = set(st.session_state.hubs_config.get_zones_to_hub_mapping().keys())
-        hub_orders_delivered = len([stop.order for route in solution.routes
-                                   for stop in route.stops
-                                   if stop.order and stop.order.kota and stop.order.kota.upper() in all_hub_zones])
+        hub_orders_delivered = int(df_routes["City/Zone"].str.upper().isin(all_hub_zones).sum())
         direct_orders_delivered = solution.total_orders_delivered - hub_orders_delivered
 
         col_hub1, col_hub2, col_hub3 = st.columns(3)
@@ -1242,7 +1417,7 @@ def render_results_section():
             st.metric("Hub %", f"{hub_pct:.1f}%")
 
         # Show Blind Van consolidation details
-        blind_van_routes = [r for r in solution.routes if r.vehicle.name == "Blind Van"]
+        blind_van_routes = routes_by_vehicle.get("Blind Van", [])
         if blind_van_routes:
             st.info(
                 f"🚚 **Blind Van Consolidation:**\n"
@@ -1261,50 +1436,21 @@ def render_results_section():
     # Download Excel
     with col_dl1:
         st.write("**Excel Report**")
-        if st.session_state.excel_path and os.path.exists(st.session_state.excel_path):
-            with open(st.session_state.excel_path, 'rb') as f:
-                excel_bytes = f.read()
-
-            st.download_button(
-                label="📥 Download Excel",
-                data=excel_bytes,
-                file_name=Path(st.session_state.excel_path).name,
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                type="primary",
-                width="stretch"
-            )
+        render_file_download(
+            st.session_state.excel_path,
+            label="📥 Download Excel",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        )
 
     # Download CSV Routes
     with col_dl2:
         st.write("**CSV Routes**")
-        if 'csv_path' in st.session_state and st.session_state.csv_path and os.path.exists(st.session_state.csv_path):
-            with open(st.session_state.csv_path, 'rb') as f:
-                csv_bytes = f.read()
-
-            st.download_button(
-                label="📥 Download CSV",
-                data=csv_bytes,
-                file_name=Path(st.session_state.csv_path).name,
-                mime="text/csv",
-                type="primary",
-                width="stretch"
-            )
+        render_file_download(st.session_state.csv_path, label="📥 Download CSV", mime="text/csv")
 
     # Download CSV Summary
     with col_dl3:
         st.write("**CSV Summary**")
-        if 'csv_summary_path' in st.session_state and st.session_state.csv_summary_path and os.path.exists(st.session_state.csv_summary_path):
-            with open(st.session_state.csv_summary_path, 'rb') as f:
-                csv_summary_bytes = f.read()
-
-            st.download_button(
-                label="📥 Download Summary",
-                data=csv_summary_bytes,
-                file_name=Path(st.session_state.csv_summary_path).name,
-                mime="text/csv",
-                type="primary",
-                width="stretch"
-            )
+        render_file_download(st.session_state.csv_summary_path, label="📥 Download Summary", mime="text/csv")
 
     st.markdown(
         f'<div class="info-box">'
@@ -1314,8 +1460,59 @@ def render_results_section():
     )
 
 
+@st.cache_resource(show_spinner=False, max_entries=16)
+def read_report_bytes(file_path: str, mtime: float) -> bytes:
+    """Read a report file once per modification time (bytes are immutable, so no copy per rerun)"""
+    return Path(file_path).read_bytes()
+
+
+def render_file_download(file_path, label: str, mime: str):
+    """Render a download button for a generated report file, if it exists"""
+    if not file_path or not os.path.exists(file_path):
+        return
+
+    st.download_button(
+        label=label,
+        data=read_report_bytes(str(file_path), os.path.getmtime(file_path)),
+        file_name=Path(file_path).name,
+        mime=mime,
+        type="primary",
+        width="stretch"
+    )
+
+
+HISTORICAL_TABLE_COLUMN_CONFIG = {
+    "Created": st.column_config.DatetimeColumn(format="YYYY-MM-DD HH:mm:ss"),
+    "Size": st.column_config.NumberColumn(format="%.1f KB"),
+}
+
+
+@st.cache_data(ttl="60s", max_entries=16, show_spinner=False)
+def load_historical_results(results_dir: str, dir_mtime: float) -> pd.DataFrame:
+    """List saved routing results, newest first (dir_mtime is only part of the cache key)"""
+    # Get all Excel files in a single directory scan
+    with os.scandir(results_dir) as entries:
+        excel_files = [
+            (entry.name, entry.stat())
+            for entry in entries
+            if entry.name.startswith("routing_result_") and entry.name.endswith(".xlsx") and entry.is_file()
+        ]
+    excel_files.sort(key=lambda item: item[1].st_mtime, reverse=True)  # Newest first
+
+    # Formatting is left to HISTORICAL_TABLE_COLUMN_CONFIG
+    mtimes = pd.Series([stat.st_mtime for _, stat in excel_files], dtype="float64")
+    sizes = pd.Series([stat.st_size for _, stat in excel_files], dtype="float64")
+    local_tz = datetime.now().astimezone().tzinfo
+    return pd.DataFrame({
+        "Filename": [name for name, _ in excel_files],
+        "Created": pd.to_datetime(mtimes, unit="s", utc=True).dt.tz_convert(local_tz).dt.tz_localize(None),
+        "Size": sizes / 1024,
+    })
+
+
+@st.fragment
 def render_historical_results():
-    """Render the historical results viewer"""
+    """Render the historical results viewer (a fragment: picking a file reruns only this section)"""
     st.header("📜 5. Historical Results")
 
     results_dir = Path("results")
@@ -1324,50 +1521,34 @@ def render_historical_results():
         st.info("ℹ️ Belum ada hasil routing yang tersimpan.")
         return
 
-    # Get all Excel files
-    excel_files = list(results_dir.glob("routing_result_*.xlsx"))
-    excel_files.sort(reverse=True)  # Newest first
+    # Rescan only when a result is added or removed (directory mtime) or the TTL expires
+    df_historical = load_historical_results(str(results_dir), results_dir.stat().st_mtime)
 
-    if not excel_files:
+    if df_historical.empty:
         st.info("ℹ️ Belum ada hasil routing yang tersimpan.")
         return
 
-    st.write(f"Ditemukan **{len(excel_files)}** hasil routing:")
-
-    # Create DataFrame for historical results
-    historical_data = []
-    for filepath in excel_files:
-        stat = filepath.stat()
-        historical_data.append({
-            "Filename": filepath.name,
-            "Created": datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S"),
-            "Size": f"{stat.st_size / 1024:.1f} KB",
-            "Path": str(filepath)
-        })
-
-    df_historical = pd.DataFrame(historical_data)
+    st.write(f"Ditemukan **{len(df_historical)}** hasil routing:")
+    filenames = df_historical["Filename"].tolist()
 
     # Display table
-    st.dataframe(df_historical[["Filename", "Created", "Size"]], width="stretch")
+    st.dataframe(df_historical, width="stretch", column_config=HISTORICAL_TABLE_COLUMN_CONFIG)
 
     # Download section
     st.subheader("Download Historical Result")
 
     selected_file = st.selectbox(
         "Pilih file untuk download:",
-        options=[f["Filename"] for f in historical_data]
+        options=filenames
     )
 
     if selected_file:
         filepath = results_dir / selected_file
 
         if filepath.exists():
-            with open(filepath, 'rb') as f:
-                excel_bytes = f.read()
-
             st.download_button(
                 label=f"📥 Download {selected_file}",
-                data=excel_bytes,
+                data=read_report_bytes(str(filepath), filepath.stat().st_mtime),
                 file_name=selected_file,
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                 width="stretch"
@@ -1438,11 +1619,18 @@ def render_sidebar():
             debug_enabled = st.checkbox("Enable debug logging", value=False)
             if debug_enabled:
                 save_distance_matrix = st.checkbox("Save distance matrix to CSV", value=False)
+                profile_sections = st.checkbox(
+                    "Show section render times",
+                    value=False,
+                    help="Time each page section on every rerun (shown at the bottom of the page)"
+                )
                 st.session_state.debug_mode = True
                 st.session_state.save_distance_matrix = save_distance_matrix
+                st.session_state.profile_sections = profile_sections
             else:
                 st.session_state.debug_mode = False
                 st.session_state.save_distance_matrix = False
+                st.session_state.profile_sections = False
 
         st.markdown("---")
 
@@ -1491,7 +1679,7 @@ def render_sidebar():
         # Check cache directory
         cache_dir = Path(".cache")
         if cache_dir.exists():
-            cache_files = list(cache_dir.glob("*.json"))
+            cache_files = list(cache_dir.glob("distance_matrix_*"))
             st.info(f"💾 Cache: {len(cache_files)} files")
 
         # Check results directory
@@ -1515,49 +1703,78 @@ def render_sidebar():
         """)
 
 
+FOOTER_MARKDOWN = (
+    '---\n\n'
+    '<p style="text-align: center; color: #666; font-size: 0.9rem;">'
+    '🚚 Segarloka VRP Solver v0.1.0 | Built with ❤️ using Streamlit & OR-Tools'
+    '</p>'
+)
+
+
+def run_timed(section_times: dict, section: str, render_fn, *args):
+    """Run a page section and record how long it took (in ms)"""
+    start = time.perf_counter()
+    result = render_fn(*args)
+    section_times[section] = (time.perf_counter() - start) * 1000
+    return result
+
+
+def render_section_times(section_times: dict):
+    """Show per-section render times collected by run_timed"""
+    with st.expander("⏱️ Section render times", expanded=True):
+        df_times = pd.DataFrame({
+            "Section": list(section_times.keys()),
+            "Time (ms)": list(section_times.values()),
+        })
+        st.dataframe(
+            df_times,
+            width="stretch",
+            column_config={"Time (ms)": st.column_config.NumberColumn(format="%.1f")}
+        )
+
+
 def main():
     """Main application entry point"""
+    section_times = {}
 
     # Initialize session state
     initialize_session_state()
 
     # Render sidebar
-    render_sidebar()
+    run_timed(section_times, "Sidebar", render_sidebar)
 
     # Render header
-    render_header()
+    run_timed(section_times, "Header", render_header)
 
     # Render upload section
-    render_upload_section()
+    run_timed(section_times, "Upload", render_upload_section)
 
     st.markdown("---")
 
     # Render configuration section
-    optimization_strategy, time_limit = render_configuration_section()
+    optimization_strategy, time_limit = run_timed(section_times, "Configuration", render_configuration_section)
 
     st.markdown("---")
 
     # Render processing section
-    render_processing_section(optimization_strategy, time_limit)
+    run_timed(section_times, "Processing", render_processing_section, optimization_strategy, time_limit)
 
     st.markdown("---")
 
     # Render results section
-    render_results_section()
+    run_timed(section_times, "Results", render_results_section)
 
     st.markdown("---")
 
     # Render historical results
-    render_historical_results()
+    run_timed(section_times, "Historical results", render_historical_results)
 
-    # Footer
-    st.markdown("---")
-    st.markdown(
-        '<p style="text-align: center; color: #666; font-size: 0.9rem;">'
-        '🚚 Segarloka VRP Solver v0.1.0 | Built with ❤️ using Streamlit & OR-Tools'
-        '</p>',
-        unsafe_allow_html=True
-    )
+    # Debug: per-section timings to find what dominates a rerun
+    if st.session_state.get("profile_sections", False):
+        render_section_times(section_times)
+
+    # Footer (separator and footer text in one element)
+    st.markdown(FOOTER_MARKDOWN, unsafe_allow_html=True)
 
 
 if __name__ == "__main__":
@@ -42,6 +42,19 @@ class Location:
         """Get coordinates as tuple."""
         return self.coordinates
 
+    @classmethod
+    def from_order(cls, order) -> "Location":
+        """
+        Create the delivery location of an order.
+
+        Args:
+            order: Order to take name, coordinates and address from
+
+        Returns:
+            Location object
+        """
+        return cls(name=order.display_name, coordinates=order.coordinates, address=order.alamat)
+
     def __repr__(self) -> str:
         """String representation of the location."""
         return f"Location({self.name}, {self.coordinates})"
@@ -244,12 +244,9 @@ class BlindVanRouter:
 
         Corridor = orders where detour is within max_detour_km and max_detour_minutes.
         """
-        candidates = []
-
-        # Direct distance/time from start to end
-        direct_distance = self.distance_matrix[start_idx][end_idx]
-        direct_duration = self.duration_matrix[start_idx][end_idx]
-
+        # Orders still available that have a matrix index
+        eligible_orders = []
+        order_indices = []
         for order in depot_orders:
             # Skip already selected orders
             if order.sale_order_id in excluded_ids:
@@ -260,31 +257,48 @@ class BlindVanRouter:
             if order_idx < 0:
                 continue
 
-            # Calculate detour: start -> order -> end vs start -> end
-            dist_to_order = self.distance_matrix[start_idx][order_idx]
-            dist_order_to_end = self.distance_matrix[order_idx][end_idx]
-            total_distance = dist_to_order + dist_order_to_end
+            eligible_orders.append(order)
+            order_indices.append(order_idx)
+
+        if not eligible_orders:
+            return []
+
+        distance_matrix = np.asarray(self.distance_matrix)
+        duration_matrix = np.asarray(self.duration_matrix)
+        order_indices = np.asarray(order_indices)
 
-            time_to_order = self.duration_matrix[start_idx][order_idx]
-            time_order_to_end = self.duration_matrix[order_idx][end_idx]
-            total_time = time_to_order + time_order_to_end + self.DELIVERY_SERVICE_TIME
+        # Direct distance/time from start to end
+        direct_distance = distance_matrix[start_idx, end_idx]
+        direct_duration = duration_matrix[start_idx, end_idx]
+
+        # Detour for all orders at once: start -> order -> end vs start -> end
+        total_distance = distance_matrix[start_idx, order_indices] + distance_matrix[order_indices, end_idx]
+        total_time = (
+            duration_matrix[start_idx, order_indices]
+            + duration_matrix[order_indices, end_idx]
+            + self.DELIVERY_SERVICE_TIME
+        )
 
-            detour_km = total_distance - direct_distance
-            detour_minutes = total_time - direct_duration
+        detour_km = total_distance - direct_distance
+        detour_minutes = total_time - direct_duration
 
-            # Check if within corridor constraints
-            if detour_km <= config.max_detour_km and detour_minutes <= config.max_detour_minutes:
-                # Score: prefer lower detour and lighter weight
-                score = detour_km * 2 + detour_minutes / 10
+        # Score: prefer lower detour and lighter weight
+        scores = detour_km * 2 + detour_minutes / 10
 
-                candidates.append(EnRouteCandidate(
-                    order=order,
-                    order_index=order_idx,
-                    segment_hub_id=hub_id,
-                    detour_km=detour_km,
-                    detour_minutes=detour_minutes,
-                    score=score,
-                ))
+        # Check if within corridor constraints
+        within_corridor = (detour_km <= config.max_detour_km) & (detour_minutes <= config.max_detour_minutes)
+
+        candidates = [
+            EnRouteCandidate(
+                order=eligible_orders[i],
+                order_index=int(order_indices[i]),
+                segment_hub_id=hub_id,
+                detour_km=float(detour_km[i]),
+                detour_minutes=float(detour_minutes[i]),
+                score=float(scores[i]),
+            )
+            for i in np.flatnonzero(within_corridor)
+        ]
 
         return candidates
 
@@ -224,12 +224,7 @@ class MultiTripSolver:
         self, matrix: np.ndarray, indices: List[int]
     ) -> np.ndarray:
         """Extract submatrix for given indices."""
-        n = len(indices)
-        submatrix = np.zeros((n, n))
-        for i, idx_i in enumerate(indices):
-            for j, idx_j in enumerate(indices):
-                submatrix[i, j] = matrix[idx_i, idx_j]
-        return submatrix
+        return matrix[np.ix_(indices, indices)]
 
     def _assign_physical_vehicles(
         self,
@@ -17,6 +17,13 @@ Tier 2: Motors from each hub serve that hub's orders, Motors from DEPOT serve di
 from typing import List, Tuple, Optional, Dict
 import numpy as np
 import time as time_module
+import multiprocessing
+import threading
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+import hashlib
+import pickle
+from collections import OrderedDict
 
 from ..models.order import Order
 from ..models.vehicle import VehicleFleet, Vehicle
@@ -35,6 +42,87 @@ class TwoTierRoutingError(Exception):
     pass
 
 
+def _solve_tier2_subproblem(
+    source_id: str,
+    source_location: Location,
+    orders: List[Order],
+    fleet: VehicleFleet,
+    distance_matrix: np.ndarray,
+    duration_matrix: np.ndarray,
+    config: dict,
+    time_limit: int,
+    vehicle_offset: int
+) -> Tuple[List[Route], List[Order]]:
+    """
+    Solve motor routing for one Tier 2 source (a hub or the DEPOT).
+
+    Module-level, so worker processes are sent only this source's sub-problem
+    rather than the whole MultiHubVRPSolver and its full matrices.
+
+    Args:
+        source_id: Hub identifier, or "DEPOT"
+        source_location: Hub or depot the motors start from
+        orders: Orders to deliver from this source
+        fleet: Allocated fleet for this source
+        distance_matrix: Distance sub-matrix [source, orders...]
+        duration_matrix: Duration sub-matrix [source, orders...]
+        config: Configuration dictionary
+        time_limit: Time limit in seconds
+        vehicle_offset: Vehicle ID offset
+
+    Returns:
+        Tuple of (routes, unassigned_orders)
+    """
+    # Check if multi-trip is enabled
+    multi_trip_config = config.get("routing", {}).get("multi_trip", {})
+    use_multi_trip = (
+        multi_trip_config.get("enabled", False)
+        and fleet.multiple_trips
+    )
+
+    try:
+        if use_multi_trip:
+            solver = MultiTripSolver(
+                orders=orders,
+                fleet=fleet,
+                depot=source_location,
+                distance_matrix=distance_matrix,
+                duration_matrix=duration_matrix,
+                config=config,
+            )
+            solution = solver.solve("balanced", time_limit, source=source_id)
+        else:
+            solver = VRPSolver(
+                orders=orders,
+                fleet=fleet,
+                depot=source_location,
+                distance_matrix=distance_matrix,
+                duration_matrix=duration_matrix,
+                vehicle_id_offset=vehicle_offset,
+                config=config,
+            )
+            solution = solver.solve("balanced", time_limit)
+            # Mark routes as originating from this source
+            for route in solution.routes:
+                route.source = source_id
+
+        # Add source prefix to vehicle names
+        for route in solution.routes:
+            route.vehicle.name = f"{source_id.upper()}-{route.vehicle.name}"
+
+        print(f"[Tier 2-{source_id}] {len(solution.routes)} routes, {solution.total_orders_delivered} orders delivered")
+        if solution.unassigned_orders:
+            print(f"[Tier 2-{source_id}] Warning: {len(solution.unassigned_orders)} unassigned orders")
+
+        return solution.routes, solution.unassigned_orders
+
+    except Exception as e:
+        print(f"[Tier 2-{source_id}] Error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return [], orders
+
+
 class MultiHubVRPSolver:
     """
     Multi-hub two-tier routing solver.
@@ -50,6 +138,19 @@ class MultiHubVRPSolver:
     - Index N+1 onwards: Customers
     """
 
+    # Max worker processes for Tier 2 sources solved side by side
+    # (OR-Tools holds the GIL during search, so threads would not overlap)
+    TIER2_MAX_WORKERS = 4
+    # Worker pool shared by all solves in this process (spawned once, not per solve)
+    _tier2_executor = None
+    _tier2_executor_lock = threading.Lock()
+
+    # Tier 2 sub-problem solutions kept per process, keyed by their inputs, so a
+    # re-run where only some sources' orders changed reuses the unchanged ones
+    TIER2_CACHE_SIZE = 32
+    _tier2_cache = OrderedDict()
+    _tier2_cache_lock = threading.Lock()  # Concurrent solves share the cache
+
     def __init__(
         self,
         orders: List[Order],
@@ -436,6 +537,8 @@ class MultiHubVRPSolver:
         # Allocate vehicles across all sources
         source_fleets = self._allocate_vehicles_to_sources()
 
+        jobs = []
+        results = []
         for source_id, source_orders in self.classified_orders.items():
             if not source_orders:
                 continue
@@ -445,138 +548,182 @@ class MultiHubVRPSolver:
                 print(f"[Tier 2] Warning: No fleet allocated for {source_id}")
                 continue
 
+            # Each source numbers its vehicles from its own block, so offsets are
+            # known up front whether sources are solved in turn or in parallel
+            source_offset = vehicle_id_offset
+            vehicle_id_offset += source_fleet.get_max_vehicles()
+
+            label = "DEPOT" if source_id == MultiHubRoutingManager.DIRECT_KEY else source_id
+            cache_key = self._tier2_cache_key(source_id, source_orders, source_fleet, time_limit, source_offset)
+            with self._tier2_cache_lock:
+                cached = self._tier2_cache.get(cache_key)
+                if cached is not None:
+                    self._tier2_cache.move_to_end(cache_key)
+            if cached is not None:
+                print(f"\n[Tier 2-{label}] Reusing solution for {len(source_orders)} unchanged orders")
+                results.append(pickle.loads(cached))  # Fresh copies, the cache entry stays intact
+                continue
+
             if source_id == MultiHubRoutingManager.DIRECT_KEY:
-                # Direct orders from DEPOT
                 print(f"\n[Tier 2-DEPOT] Solving {len(source_orders)} direct orders...")
-                routes, unassigned = self._solve_tier2_from_depot(
-                    source_orders, source_fleet, time_limit, vehicle_id_offset
-                )
             else:
-                # Orders from specific hub
                 hub_config = self.hub_config.get_hub_by_id(source_id)
                 hub_name = hub_config.hub.name if hub_config else source_id
                 print(f"\n[Tier 2-{source_id}] Solving {len(source_orders)} orders from {hub_name}...")
-                routes, unassigned = self._solve_tier2_from_hub(
-                    source_id, source_orders, source_fleet, time_limit, vehicle_id_offset
-                )
 
+            subproblem = self._build_tier2_subproblem(
+                source_id, source_orders, source_fleet, time_limit, source_offset
+            )
+            if subproblem is None:
+                results.append(([], source_orders))
+                continue
+
+            jobs.append((len(results), cache_key, subproblem))
+            results.append(None)  # Filled in once solved
+
+        solved = None
+        if len(jobs) > 1 and self.TIER2_MAX_WORKERS > 1:
+            # Sources are independent sub-problems with their own time limit, so solve
+            # them in parallel processes (spawned, since the app host is multi-threaded)
+            executor = self._get_tier2_executor()
+            try:
+                futures = [
+                    executor.submit(_solve_tier2_subproblem, *subproblem)
+                    for _, _, subproblem in jobs
+                ]
+                solved = [future.result() for future in futures]
+            except BrokenProcessPool:
+                print("[Tier 2] Worker pool failed, solving sources sequentially")
+                self._discard_tier2_executor(executor)
+
+        if solved is None:
+            solved = [_solve_tier2_subproblem(*subproblem) for _, _, subproblem in jobs]
+
+        for (result_idx, cache_key, _), (routes, unassigned) in zip(jobs, solved):
+            results[result_idx] = (routes, unassigned)
+            if routes:  # Failed solves return no routes; don't keep those
+                self._remember_tier2_solution(cache_key, (routes, unassigned))
+
+        # Combine in source order
+        for routes, unassigned in results:
             all_routes.extend(routes)
             all_unassigned.extend(unassigned)
-            vehicle_id_offset += len(routes)
 
         return all_routes, all_unassigned
 
-    def _solve_tier2_from_hub(
+    @classmethod
+    def _get_tier2_executor(cls) -> concurrent.futures.ProcessPoolExecutor:
+        """Get the Tier 2 worker pool, creating it on first use."""
+        with cls._tier2_executor_lock:
+            if cls._tier2_executor is None:
+                cls._tier2_executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=cls.TIER2_MAX_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return cls._tier2_executor
+
+    @classmethod
+    def _discard_tier2_executor(cls, executor: concurrent.futures.ProcessPoolExecutor):
+        """Drop a broken Tier 2 worker pool, so the next solve starts a fresh one."""
+        with cls._tier2_executor_lock:
+            if cls._tier2_executor is executor:
+                cls._tier2_executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _tier2_cache_key(
         self,
-        hub_id: str,
+        source_id: str,
         orders: List[Order],
         fleet: VehicleFleet,
         time_limit: int,
         vehicle_offset: int
-    ) -> Tuple[List[Route], List[Order]]:
+    ) -> str:
         """
-        Solve motor routing from a specific hub.
+        Fingerprint everything a Tier 2 sub-problem depends on.
 
         Args:
-            hub_id: Hub identifier
-            orders: Orders to deliver from this hub
-            fleet: Allocated fleet for this hub
+            source_id: Hub identifier, or MultiHubRoutingManager.DIRECT_KEY for DEPOT
+            orders: Orders served from this source
+            fleet: Allocated fleet for this source
             time_limit: Time limit in seconds
             vehicle_offset: Vehicle ID offset
 
         Returns:
-            Tuple of (routes, unassigned_orders)
+            Cache key string
         """
-        hub_config = self.hub_config.get_hub_by_id(hub_id)
-        if not hub_config:
-            print(f"[Tier 2] Error: Hub {hub_id} not found")
-            return [], orders
-
-        hub_matrix_idx = self.index_manager.get_hub_index(hub_id)
-
-        # Build sub-matrix: [HUB, orders...]
-        order_indices = []
-        for order in orders:
-            try:
-                order_idx = self.orders.index(order)
-                order_indices.append(self.index_manager.get_customer_index(order_idx))
-            except ValueError:
-                continue
-
-        all_indices = [hub_matrix_idx] + order_indices
-
-        distance_matrix = self._extract_submatrix(self.full_distance_matrix, all_indices)
-        duration_matrix = self._extract_submatrix(self.full_duration_matrix, all_indices)
-
-        # Check if multi-trip is enabled
-        multi_trip_config = self.config.get("routing", {}).get("multi_trip", {})
-        use_multi_trip = (
-            multi_trip_config.get("enabled", False)
-            and fleet.multiple_trips
-        )
-
-        try:
-            if use_multi_trip:
-                solver = MultiTripSolver(
-                    orders=orders,
-                    fleet=fleet,
-                    depot=hub_config.hub,  # Use hub as depot
-                    distance_matrix=distance_matrix,
-                    duration_matrix=duration_matrix,
-                    config=self.config,
-                )
-                solution = solver.solve("balanced", time_limit, source=hub_id)
-                # Add hub prefix to vehicle names
-                for route in solution.routes:
-                    route.vehicle.name = f"{hub_id.upper()}-{route.vehicle.name}"
-            else:
-                solver = VRPSolver(
-                    orders=orders,
-                    fleet=fleet,
-                    depot=hub_config.hub,  # Use hub as depot
-                    distance_matrix=distance_matrix,
-                    duration_matrix=duration_matrix,
-                    vehicle_id_offset=vehicle_offset,
-                    config=self.config,
-                )
-                solution = solver.solve("balanced", time_limit)
-                # Mark routes as originating from this hub
-                for route in solution.routes:
-                    route.source = hub_id
-                    route.vehicle.name = f"{hub_id.upper()}-{route.vehicle.name}"
-
-            print(f"[Tier 2-{hub_id}] {len(solution.routes)} routes, {solution.total_orders_delivered} orders delivered")
-            if solution.unassigned_orders:
-                print(f"[Tier 2-{hub_id}] Warning: {len(solution.unassigned_orders)} unassigned orders")
+        if source_id == MultiHubRoutingManager.DIRECT_KEY:
+            source_idx = self.index_manager.get_depot_index()
+            source_location = self.depot
+        else:
+            source_idx = self.index_manager.get_hub_index(source_id)
+            hub_config = self.hub_config.get_hub_by_id(source_id)
+            source_location = hub_config.hub if hub_config else None
+
+        indices = [source_idx] + [
+            self.order_index_map[order.sale_order_id]
+            for order in orders
+            if order.sale_order_id in self.order_index_map
+        ]
 
-            return solution.routes, solution.unassigned_orders
+        key = hashlib.blake2b(digest_size=16)
+        key.update(pickle.dumps(
+            (source_id, source_location, orders, fleet, self.config, time_limit, vehicle_offset)
+        ))
+        key.update(self._extract_submatrix(self.full_distance_matrix, indices).tobytes())
+        key.update(self._extract_submatrix(self.full_duration_matrix, indices).tobytes())
+        return key.hexdigest()
 
-        except Exception as e:
-            print(f"[Tier 2-{hub_id}] Error: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return [], orders
+    def _remember_tier2_solution(self, cache_key: str, result: Tuple[List[Route], List[Order]]):
+        """
+        Store a Tier 2 sub-problem solution (pickled, so later runs get their own copies).
 
-    def _solve_tier2_from_depot(
+        Args:
+            cache_key: Key from _tier2_cache_key
+            result: Tuple of (routes, unassigned_orders)
+        """
+        entry = pickle.dumps(result)
+        cache = self._tier2_cache
+        with self._tier2_cache_lock:
+            cache[cache_key] = entry
+            cache.move_to_end(cache_key)
+            while len(cache) > self.TIER2_CACHE_SIZE:
+                cache.popitem(last=False)
+
+    def _build_tier2_subproblem(
         self,
+        source_id: str,
         orders: List[Order],
         fleet: VehicleFleet,
         time_limit: int,
         vehicle_offset: int
-    ) -> Tuple[List[Route], List[Order]]:
+    ) -> Optional[tuple]:
         """
-        Solve motor routing from DEPOT for direct orders.
+        Build the _solve_tier2_subproblem arguments for one Tier 2 source.
 
         Args:
-            orders: Direct orders to deliver from DEPOT
-            fleet: Allocated fleet for DEPOT
+            source_id: Hub identifier, or MultiHubRoutingManager.DIRECT_KEY for DEPOT
+            orders: Orders served from this source
+            fleet: Allocated fleet for this source
             time_limit: Time limit in seconds
             vehicle_offset: Vehicle ID offset
 
         Returns:
-            Tuple of (routes, unassigned_orders)
+            Argument tuple, or None if the hub is not configured
         """
-        # Build sub-matrix: [DEPOT, orders...]
+        if source_id == MultiHubRoutingManager.DIRECT_KEY:
+            source_name = "DEPOT"
+            source_location = self.depot
+            source_idx = self.index_manager.get_depot_index()
+        else:
+            hub_config = self.hub_config.get_hub_by_id(source_id)
+            if not hub_config:
+                print(f"[Tier 2] Error: Hub {source_id} not found")
+                return None
+            source_name = source_id
+            source_location = hub_config.hub  # Use hub as depot
+            source_idx = self.index_manager.get_hub_index(source_id)
+
+        # Build sub-matrix: [source, orders...]
         order_indices = []
         for order in orders:
             try:
@@ -585,60 +732,20 @@ class MultiHubVRPSolver:
             except ValueError:
                 continue
 
-        all_indices = [self.index_manager.get_depot_index()] + order_indices
-
-        distance_matrix = self._extract_submatrix(self.full_distance_matrix, all_indices)
-        duration_matrix = self._extract_submatrix(self.full_duration_matrix, all_indices)
-
-        # Check if multi-trip is enabled
-        multi_trip_config = self.config.get("routing", {}).get("multi_trip", {})
-        use_multi_trip = (
-            multi_trip_config.get("enabled", False)
-            and fleet.multiple_trips
+        all_indices = [source_idx] + order_indices
+
+        return (
+            source_name,
+            source_location,
+            orders,
+            fleet,
+            self._extract_submatrix(self.full_distance_matrix, all_indices),
+            self._extract_submatrix(self.full_duration_matrix, all_indices),
+            self.config,
+            time_limit,
+            vehicle_offset,
         )
 
-        try:
-            if use_multi_trip:
-                solver = MultiTripSolver(
-                    orders=orders,
-                    fleet=fleet,
-                    depot=self.depot,
-                    distance_matrix=distance_matrix,
-                    duration_matrix=duration_matrix,
-                    config=self.config,
-                )
-                solution = solver.solve("balanced", time_limit, source="DEPOT")
-                # Add DEPOT prefix to vehicle names
-                for route in solution.routes:
-                    route.vehicle.name = f"DEPOT-{route.vehicle.name}"
-            else:
-                solver = VRPSolver(
-                    orders=orders,
-                    fleet=fleet,
-                    depot=self.depot,
-                    distance_matrix=distance_matrix,
-                    duration_matrix=duration_matrix,
-                    vehicle_id_offset=vehicle_offset,
-                    config=self.config,
-                )
-                solution = solver.solve("balanced", time_limit)
-                # Mark routes as from DEPOT
-                for route in solution.routes:
-                    route.source = "DEPOT"
-                    route.vehicle.name = f"DEPOT-{route.vehicle.name}"
-
-            print(f"[Tier 2-DEPOT] {len(solution.routes)} routes, {solution.total_orders_delivered} orders delivered")
-            if solution.unassigned_orders:
-                print(f"[Tier 2-DEPOT] Warning: {len(solution.unassigned_orders)} unassigned orders")
-
-            return solution.routes, solution.unassigned_orders
-
-        except Exception as e:
-            print(f"[Tier 2-DEPOT] Error: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return [], orders
-
     def _allocate_vehicles_to_sources(self) -> Dict[str, VehicleFleet]:
         """
         Allocate vehicles proportionally across sources based on weight.
@@ -712,12 +819,7 @@ class MultiHubVRPSolver:
         Returns:
             Sub-matrix of shape (len(indices), len(indices))
         """
-        n = len(indices)
-        submatrix = np.zeros((n, n))
-        for i, idx1 in enumerate(indices):
-            for j, idx2 in enumerate(indices):
-                submatrix[i, j] = matrix[idx1, idx2]
-        return submatrix
+        return matrix[np.ix_(indices, indices)]
 
     def _get_blind_van_vehicle(self) -> Optional[Vehicle]:
         """Get Blind Van vehicle from fleet."""
@@ -59,14 +59,7 @@ class VRPSolver:
         self.config = config or {}
 
         # Create locations list: depot + customer locations
-        self.locations = [depot] + [
-            Location(
-                name=order.display_name,
-                coordinates=order.coordinates,
-                address=order.alamat,
-            )
-            for order in orders
-        ]
+        self.locations = [depot] + [Location.from_order(order) for order in orders]
 
         # Validate matrix dimensions
         n_locations = len(self.locations)
@@ -76,6 +69,14 @@ class VRPSolver:
                 f"number of locations {n_locations}"
             )
 
+        # Pre-scale matrices once to the integer units used by OR-Tools transits
+        # (meters, whole minutes + service time, grams) as plain Python lists
+        self.distance_matrix_m = (distance_matrix * 1000).astype(np.int64).tolist()
+        transit_time = duration_matrix.astype(np.int64)
+        transit_time[:, 1:] += self.SERVICE_TIME  # No service time when returning to depot
+        self.transit_time_matrix = transit_time.tolist()
+        self.demands_g = [0] + [int(order.load_weight_in_kg * 1000) for order in orders]
+
         # Get all vehicles from fleet with offset
         self.vehicles = fleet.get_all_vehicles(start_id=vehicle_id_offset)
 
@@ -187,16 +188,10 @@ class VRPSolver:
 
     def _register_distance_callback(self):
         """Register distance callback for OR-Tools."""
-
-        def distance_callback(from_index, to_index):
-            """Returns the distance between two nodes."""
-            from_node = self.manager.IndexToNode(from_index)
-            to_node = self.manager.IndexToNode(to_index)
-            # Convert km to meters for OR-Tools (use integers)
-            return int(self.distance_matrix[from_node, to_node] * 1000)
-
-        self.distance_callback_index = self.routing.RegisterTransitCallback(
-            distance_callback
+        # Distance in meters (OR-Tools needs integers). Registering the matrix itself
+        # keeps arc lookups in C++ instead of calling back into Python on every arc.
+        self.distance_callback_index = self.routing.RegisterTransitMatrix(
+            self.distance_matrix_m
         )
 
         # Set cost of travel (arc cost evaluator)
@@ -204,37 +199,16 @@ class VRPSolver:
 
     def _register_time_callback(self):
         """Register time callback for OR-Tools."""
-
-        def time_callback(from_index, to_index):
-            """Returns travel time + service time."""
-            from_node = self.manager.IndexToNode(from_index)
-            to_node = self.manager.IndexToNode(to_index)
-
-            # Travel time in minutes
-            travel_time = int(self.duration_matrix[from_node, to_node])
-
-            # Add service time if not returning to depot
-            service_time = self.SERVICE_TIME if to_node != 0 else 0
-
-            return travel_time + service_time
-
-        self.time_callback_index = self.routing.RegisterTransitCallback(
-            time_callback
+        # Travel time in minutes, plus service time if not returning to depot
+        self.time_callback_index = self.routing.RegisterTransitMatrix(
+            self.transit_time_matrix
         )
 
     def _register_demand_callback(self):
         """Register demand (weight) callback for OR-Tools."""
-
-        def demand_callback(from_index):
-            """Returns the demand (weight) of the node."""
-            from_node = self.manager.IndexToNode(from_index)
-            if from_node == 0:  # depot
-                return 0
-            # Convert to grams for integer precision
-            return int(self.orders[from_node - 1].load_weight_in_kg * 1000)
-
-        self.demand_callback_index = self.routing.RegisterUnaryTransitCallback(
-            demand_callback
+        # Weight in grams for integer precision (0 for depot)
+        self.demand_callback_index = self.routing.RegisterUnaryTransitVector(
+            self.demands_g
         )
 
     def _add_capacity_constraint(self):
@@ -487,58 +461,47 @@ class VRPSolver:
         vehicle = self.fleet.get_vehicle_by_index(vehicle_id)
         route = Route(vehicle=vehicle)
 
+        # Walk the solver's route once, then compute per-stop metrics in bulk
         index = self.routing.Start(vehicle_id)
-        sequence = 0
-        cumulative_weight = 0
-        prev_node = 0
+        nodes = []
+        arrival_times = []
 
         while not self.routing.IsEnd(index):
             node = self.manager.IndexToNode(index)
-            time_var = time_dimension.CumulVar(index)
-            arrival_time = self.solution.Min(time_var)
-
             if node != 0:  # Skip depot
-                order = self.orders[node - 1]
-                cumulative_weight += order.load_weight_in_kg
-
-                # Calculate distance from previous stop
-                distance_from_prev = self.distance_matrix[prev_node, node]
-
-                # Create route stop
-                stop = RouteStop(
-                    order=order,
-                    arrival_time=arrival_time,
-                    departure_time=arrival_time + self.SERVICE_TIME,
-                    distance_from_prev=distance_from_prev,
-                    cumulative_weight=cumulative_weight,
-                    sequence=sequence,
-                )
-
-                route.add_stop(stop)
-                sequence += 1
-
-            prev_node = node
+                time_var = time_dimension.CumulVar(index)
+                nodes.append(node)
+                arrival_times.append(self.solution.Min(time_var))
             index = self.solution.Value(self.routing.NextVar(index))
 
-        # Add return distance to depot
-        if route.num_stops > 0:
-            last_node = self.manager.IndexToNode(
-                self.solution.Value(
-                    self.routing.NextVar(
-                        self.manager.NodeToIndex(prev_node)
+        if nodes:
+            orders = [self.orders[node - 1] for node in nodes]
+            weights = np.array([order.load_weight_in_kg for order in orders], dtype=float)
+            cumulative_weights = np.cumsum(weights)
+
+            # Leg distances: depot -> first stop, then stop -> next stop
+            prev_nodes = [0] + nodes[:-1]
+            leg_distances = self.distance_matrix[prev_nodes, nodes]
+
+            for sequence, (order, arrival_time) in enumerate(zip(orders, arrival_times)):
+                route.add_stop(
+                    RouteStop(
+                        order=order,
+                        arrival_time=arrival_time,
+                        departure_time=arrival_time + self.SERVICE_TIME,
+                        distance_from_prev=float(leg_distances[sequence]),
+                        cumulative_weight=float(cumulative_weights[sequence]),
+                        sequence=sequence,
                     )
                 )
-            )
-            # Since last_node should be the end node, we use prev_node to get back to depot
-            return_distance = self.distance_matrix[prev_node, 0]
-            route.total_distance = sum(
-                stop.distance_from_prev for stop in route.stops
-            ) + return_distance
+
+            # Add return distance to depot
+            return_distance = self.distance_matrix[nodes[-1], 0]
+            route.total_distance = float(leg_distances.sum() + return_distance)
 
             # Set departure time (earliest order time - 30 minutes)
-            if route.stops:
-                earliest_time = min(stop.order.time_window_start for stop in route.stops)
-                route.departure_time = max(0, earliest_time - 30)
+            earliest_time = min(order.time_window_start for order in orders)
+            route.departure_time = max(0, earliest_time - 30)
 
         # Calculate metrics
         route.calculate_metrics()
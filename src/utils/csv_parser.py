@@ -4,7 +4,7 @@ Parses order CSV files and creates Order objects with validation.
 """
 
 import pandas as pd
-from typing import List, Tuple
+from typing import IO, List, Tuple, Union
 from ..models.order import Order
 
 
@@ -42,12 +42,14 @@ class CSVParser:
     COORDINATE_COLUMNS_COMBINED = ["coordinates"]
     COORDINATE_COLUMNS_SEPARATE = ["partner_latitude", "partner_longitude"]
 
-    def __init__(self, csv_path: str):
+    TRUE_VALUES = ("true", "1", "yes", "y")
+
+    def __init__(self, csv_path: Union[str, IO, None] = None):
         """
         Initialize CSV parser.
 
         Args:
-            csv_path: Path to CSV file
+            csv_path: Path to CSV file, or a file-like object (e.g. an uploaded file buffer)
         """
         self.csv_path = csv_path
         self.df = None
@@ -64,7 +66,7 @@ class CSVParser:
             CSVParserError: If parsing fails or validation errors occur
         """
         try:
-            # Read CSV file
+            # Read CSV file (path or file-like object)
             self.df = pd.read_csv(self.csv_path)
         except FileNotFoundError:
             raise CSVParserError(f"CSV file not found: {self.csv_path}")
@@ -75,8 +77,9 @@ class CSVParser:
         self._validate_columns()
 
         # Parse orders
+        # Plain dict records avoid building a pandas Series for every row
         orders = []
-        for idx, row in self.df.iterrows():
+        for idx, row in zip(self.df.index, self.df.to_dict("records")):
             try:
                 order = self._parse_row(row, idx)
                 if order:
@@ -126,12 +129,12 @@ class CSVParser:
                 f"OR both '{self.COORDINATE_COLUMNS_SEPARATE[0]}' and '{self.COORDINATE_COLUMNS_SEPARATE[1]}'"
             )
 
-    def _parse_row(self, row: pd.Series, idx: int) -> Order:
+    def _parse_row(self, row: dict, idx: int) -> Order:
         """
         Parse a single row into an Order object.
 
         Args:
-            row: DataFrame row
+            row: DataFrame row as a column -> value mapping
             idx: Row index (for error messages)
 
         Returns:
@@ -191,13 +194,13 @@ class CSVParser:
         return order
 
     def _parse_coordinates_from_row(
-        self, row: pd.Series, idx: int
+        self, row: dict, idx: int
     ) -> Tuple[float, float]:
         """
         Parse coordinates from row - handles both combined and separate formats.
 
         Args:
-            row: DataFrame row
+            row: DataFrame row as a column -> value mapping
             idx: Row index (for error messages)
 
         Returns:
@@ -273,10 +276,25 @@ class CSVParser:
 
         if isinstance(value, str):
             value = value.strip().lower()
-            return value in ("true", "1", "yes", "y")
+            return value in self.TRUE_VALUES
 
         return False
 
+    def _parse_boolean_column(self, column: pd.Series) -> pd.Series:
+        """
+        Vectorized version of _parse_boolean for a whole column.
+
+        Args:
+            column: DataFrame column with boolean-like values (missing values count as False)
+
+        Returns:
+            Boolean Series
+        """
+        if pd.api.types.is_bool_dtype(column) or pd.api.types.is_numeric_dtype(column):
+            return column.fillna(0).astype(bool)
+
+        return column.astype(str).str.strip().str.lower().isin(self.TRUE_VALUES)
+
     def get_summary(self) -> dict:
         """
         Get summary statistics of parsed data.
@@ -287,11 +305,17 @@ class CSVParser:
         if self.df is None:
             return {}
 
+        if "is_priority" in self.df.columns:
+            priority_orders = int(self._parse_boolean_column(self.df["is_priority"]).sum())
+        else:
+            priority_orders = 0
+
         return {
             "total_rows": len(self.df),
             "unique_orders": self.df["sale_order_id"].nunique(),
             "unique_customers": self.df["partner_id"].nunique(),
-            "total_weight": self.df["load_weight_in_kg"].sum(),
+            "total_weight": float(pd.to_numeric(self.df["load_weight_in_kg"], errors="coerce").sum()),
+            "priority_orders": priority_orders,
             "date_range": (
                 self.df["delivery_date"].min(),
                 self.df["delivery_date"].max(),
@@ -3,11 +3,12 @@ Distance calculator using OSRM API.
 Calculates distance and duration matrices with caching support.
 """
 import requests
-import pickle
 import hashlib
 import os
 import time
-from datetime import datetime
+import concurrent.futures
+import threading
+from collections import OrderedDict
 from typing import List, Tuple, Dict, Optional
 import numpy as np
 from math import radians, cos, sin, asin, sqrt
@@ -25,6 +26,15 @@ class DistanceCalculator:
     Implements caching to minimize API calls.
     """
 
+    # Max coordinates per OSRM table request (OSRM's default max-table-size is 100)
+    MAX_TABLE_SIZE = 100
+
+    # Parallel table requests when a matrix has to be split into blocks
+    MAX_WORKERS = 4
+
+    # Matrices kept in memory (most recently used) in front of the disk cache
+    MEMORY_CACHE_SIZE = 32
+
     def __init__(
         self,
         cache_dir: str = ".cache",
@@ -53,6 +63,12 @@ class DistanceCalculator:
         self.api_calls = 0
         self.haversine_fallbacks = 0
 
+        # In-memory matrices keyed by cache key -> (saved_at, distance_matrix, duration_matrix).
+        # Long-lived calculators (e.g. shared by the app) skip reading .npz files on repeat runs.
+        # The app shares one calculator across sessions, so the memory cache is lock-guarded.
+        self._memory_cache = OrderedDict()
+        self._memory_cache_lock = threading.Lock()
+
         # Create cache directory if it doesn't exist
         if enable_cache:
             os.makedirs(cache_dir, exist_ok=True)
@@ -83,7 +99,10 @@ class DistanceCalculator:
         return c * r
 
     def calculate_matrix(
-        self, locations: List[Location], force_refresh: bool = False
+        self,
+        locations: List[Location],
+        force_refresh: bool = False,
+        stats: Optional[Dict[str, int]] = None
     ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Calculate distance and duration matrices for all locations.
@@ -92,11 +111,14 @@ class DistanceCalculator:
         Args:
             locations: List of Location objects (depot + customers)
             force_refresh: Force API call even if cache exists
+            stats: Optional dict filled with this call's own cache_hits, api_calls and
+                haversine_fallbacks (the instance counters add up all calls, which is
+                not per-run when the calculator is shared)
 
         Returns:
             Tuple of (distance_matrix, duration_matrix)
-            - distance_matrix: 2D array of distances in kilometers
-            - duration_matrix: 2D array of durations in minutes
+            - distance_matrix: 2D float32 array of distances in kilometers
+            - duration_matrix: 2D float32 array of durations in minutes
 
         Raises:
             DistanceCalculatorError: If API call fails
@@ -104,12 +126,16 @@ class DistanceCalculator:
         if not locations:
             raise DistanceCalculatorError("Location list cannot be empty")
 
+        call_stats = stats if stats is not None else {}
+        call_stats.update(cache_hits=0, api_calls=0, haversine_fallbacks=0)
+
         # Check cache first (if enabled and not forcing refresh)
         cache_key = self._generate_cache_key(locations)
         if self.enable_cache and not force_refresh:
             cached_result = self._load_from_cache(cache_key)
             if cached_result is not None:
                 self.cache_hits += 1
+                call_stats["cache_hits"] = 1
                 return cached_result
             self.cache_misses += 1
 
@@ -117,20 +143,15 @@ class DistanceCalculator:
         coordinates = [loc.to_tuple() for loc in locations]
         n = len(coordinates)
 
-        # Initialize matrices
-        distance_matrix = np.zeros((n, n))
-        duration_matrix = np.zeros((n, n))
+        # Initialize matrices (float32 is plenty for km/minutes and matches the cache format)
+        distance_matrix = np.zeros((n, n), dtype=np.float32)
+        duration_matrix = np.zeros((n, n), dtype=np.float32)
 
         try:
-            self.api_calls += 1
-            result = self._call_osrm_matrix_api(coordinates)
-            self._parse_osrm_response(
-                result,
-                distance_matrix,
-                duration_matrix,
-            )
+            self._fill_matrix_osrm(coordinates, distance_matrix, duration_matrix, call_stats)
         except (DistanceCalculatorError, requests.exceptions.RequestException) as e:
             self.haversine_fallbacks += 1
+            call_stats["haversine_fallbacks"] = 1
             self._fill_matrix_haversine_full(coordinates, distance_matrix, duration_matrix)
 
         # Cache the result with metadata
@@ -139,6 +160,27 @@ class DistanceCalculator:
 
         return distance_matrix, duration_matrix
 
+    def load_cached_matrix(
+        self, locations: List[Location]
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Load matrices for the given locations from the disk cache only.
+
+        Args:
+            locations: List of Location objects (depot + customers)
+
+        Returns:
+            Tuple of (distance_matrix, duration_matrix), or None if caching is
+            disabled or there is no valid cache entry
+        """
+        if not self.enable_cache or not locations:
+            return None
+
+        cached_result = self._load_from_cache(self._generate_cache_key(locations))
+        if cached_result is not None:
+            self.cache_hits += 1
+        return cached_result
+
     def _fill_matrix_haversine_full(
         self, 
         coordinates: List[Tuple[float, float]], 
@@ -154,12 +196,73 @@ class DistanceCalculator:
                 distance_matrix[i, j] = distance_km
                 duration_matrix[i, j] = duration_min
 
-    def _call_osrm_matrix_api(self, coordinates: List[Tuple[float, float]]) -> dict:
+    def _fill_matrix_osrm(
+        self,
+        coordinates: List[Tuple[float, float]],
+        distance_matrix: np.ndarray,
+        duration_matrix: np.ndarray,
+        call_stats: Optional[Dict[str, int]] = None
+    ):
+        """
+        Fill the matrices from the OSRM Table API.
+
+        Small location sets are fetched with a single request. Larger ones are
+        split into blocks of sources x destinations that fit within MAX_TABLE_SIZE
+        coordinates per request, fetched in parallel.
+
+        Args:
+            coordinates: (latitude, longitude) of each location
+            distance_matrix: Matrix to fill with distances in kilometers
+            duration_matrix: Matrix to fill with durations in minutes
+            call_stats: Optional per-call stats dict whose api_calls is incremented
+
+        Raises:
+            DistanceCalculatorError: If any request fails
+        """
+        if call_stats is None:
+            call_stats = {}
+        n = len(coordinates)
+        if n <= self.MAX_TABLE_SIZE:
+            self.api_calls += 1
+            call_stats["api_calls"] = call_stats.get("api_calls", 0) + 1
+            result = self._call_osrm_matrix_api(coordinates)
+            self._parse_osrm_response(result, distance_matrix, duration_matrix)
+            return
+
+        block_size = self.MAX_TABLE_SIZE // 2
+        blocks = [list(range(start, min(start + block_size, n))) for start in range(0, n, block_size)]
+        block_pairs = [(sources, destinations) for sources in blocks for destinations in blocks]
+        self.api_calls += len(block_pairs)
+        call_stats["api_calls"] = call_stats.get("api_calls", 0) + len(block_pairs)
+
+        def fetch_block(sources: List[int], destinations: List[int]) -> dict:
+            block_coords = [coordinates[i] for i in sources] + [coordinates[j] for j in destinations]
+            return self._call_osrm_matrix_api(
+                block_coords,
+                sources=range(len(sources)),
+                destinations=range(len(sources), len(block_coords)),
+            )
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            results = executor.map(lambda pair: fetch_block(*pair), block_pairs)
+            for (sources, destinations), result in zip(block_pairs, results):
+                self._parse_osrm_response(
+                    result, distance_matrix, duration_matrix, rows=sources, cols=destinations
+                )
+
+    def _call_osrm_matrix_api(
+        self,
+        coordinates: List[Tuple[float, float]],
+        sources: Optional[range] = None,
+        destinations: Optional[range] = None
+    ) -> dict:
         """
         Call OSRM Table Service API.
 
         Args:
             coordinates: List of (latitude, longitude) tuples
+            sources: Indices (into coordinates) to use as sources (default: all)
+            destinations: Indices (into coordinates) to use as destinations (default: all)
 
         Returns:
             API response as dictionary
@@ -172,6 +275,10 @@ class DistanceCalculator:
         params = {
             "annotations": "duration,distance"
         }
+        if sources is not None:
+            params["sources"] = ";".join(str(i) for i in sources)
+        if destinations is not None:
+            params["destinations"] = ";".join(str(i) for i in destinations)
 
         response = requests.get(url, params=params, timeout=30)
 
@@ -194,6 +301,8 @@ class DistanceCalculator:
         response: dict,
         distance_matrix: np.ndarray,
         duration_matrix: np.ndarray,
+        rows: Optional[List[int]] = None,
+        cols: Optional[List[int]] = None,
     ):
         """
         Parse OSRM API response and fill matrices.
@@ -202,6 +311,11 @@ class DistanceCalculator:
             response: API response dictionary
             distance_matrix: Distance matrix to fill
             duration_matrix: Duration matrix to fill
+            rows: Matrix rows the response covers (default: from row 0)
+            cols: Matrix columns the response covers (default: from column 0)
+
+        Raises:
+            DistanceCalculatorError: If the response is empty or has unreachable pairs
         """
         distances = response.get("distances")
         durations = response.get("durations")
@@ -209,10 +323,19 @@ class DistanceCalculator:
         if not distances or not durations:
             raise DistanceCalculatorError("Empty matrix in API response")
 
-        for i in range(len(distances)):
-            for j in range(len(distances[i])):
-                distance_matrix[i, j] = distances[i][j] / 1000.0  # Convert meters to km
-                duration_matrix[i, j] = durations[i][j] / 60.0  # Convert seconds to minutes
+        # Unreachable pairs come back as null, which becomes NaN here
+        distances = np.array(distances, dtype=np.float64) / 1000.0  # Convert meters to km
+        durations = np.array(durations, dtype=np.float64) / 60.0  # Convert seconds to minutes
+        if np.isnan(distances).any() or np.isnan(durations).any():
+            raise DistanceCalculatorError("OSRM API returned unreachable location pairs")
+
+        if rows is None:
+            rows = range(distances.shape[0])
+        if cols is None:
+            cols = range(distances.shape[1])
+        block = np.ix_(rows, cols)
+        distance_matrix[block] = distances
+        duration_matrix[block] = durations
 
     def _generate_cache_key(self, locations: List[Location]) -> str:
         """
@@ -239,7 +362,7 @@ class DistanceCalculator:
         Returns:
             Full path to cache file
         """
-        return os.path.join(self.cache_dir, f"distance_matrix_{cache_key}.pkl")
+        return os.path.join(self.cache_dir, f"distance_matrix_{cache_key}.npz")
 
     def _load_from_cache(
         self, cache_key: str
@@ -253,26 +376,32 @@ class DistanceCalculator:
         Returns:
             Tuple of (distance_matrix, duration_matrix) or None if not cached/expired
         """
+        cache_ttl_seconds = self.cache_ttl_hours * 3600
+
+        with self._memory_cache_lock:
+            memory_entry = self._memory_cache.get(cache_key)
+            if memory_entry is not None:
+                saved_at, distance_matrix, duration_matrix = memory_entry
+                if time.time() - saved_at <= cache_ttl_seconds:
+                    self._memory_cache.move_to_end(cache_key)
+                    return (distance_matrix, duration_matrix)
+                self._memory_cache.pop(cache_key, None)
+
         cache_path = self._get_cache_path(cache_key)
 
         if not os.path.exists(cache_path):
             return None
 
         try:
-            file_age = time.time() - os.path.getmtime(cache_path)
-            cache_ttl_seconds = self.cache_ttl_hours * 3600
+            saved_at = os.path.getmtime(cache_path)
 
-            if file_age > cache_ttl_seconds:
+            if time.time() - saved_at > cache_ttl_seconds:
                 os.remove(cache_path)
                 return None
 
-            with open(cache_path, "rb") as f:
-                cached_data = pickle.load(f)
-
-            if isinstance(cached_data, dict):
-                return (cached_data["distance_matrix"], cached_data["duration_matrix"])
-            else:
-                return cached_data
+            with np.load(cache_path) as cached_data:
+                data = (cached_data["distance_matrix"], cached_data["duration_matrix"])
+            return self._remember(cache_key, data, saved_at)
 
         except Exception:
             try:
@@ -285,28 +414,59 @@ class DistanceCalculator:
         self, cache_key: str, data: Tuple[np.ndarray, np.ndarray]
     ):
         """
-        Save distance and duration matrices to cache with metadata.
+        Save distance and duration matrices to cache as float32 NumPy arrays.
 
         Args:
             cache_key: Cache key
             data: Tuple of (distance_matrix, duration_matrix)
         """
+        self._remember(cache_key, data, time.time())
         cache_path = self._get_cache_path(cache_key)
 
         try:
-            cache_data = {
-                "distance_matrix": data[0],
-                "duration_matrix": data[1],
-                "cached_at": datetime.now().isoformat(),
-                "ttl_hours": self.cache_ttl_hours,
-            }
-            with open(cache_path, "wb") as f:
-                pickle.dump(cache_data, f)
+            np.savez(
+                cache_path,
+                distance_matrix=np.asarray(data[0], dtype=np.float32),
+                duration_matrix=np.asarray(data[1], dtype=np.float32),
+            )
         except Exception:
             pass
 
+    def _remember(
+        self, cache_key: str, data: Tuple[np.ndarray, np.ndarray], saved_at: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Keep copies of matrices in the in-memory cache.
+
+        The copies are stored read-only because the same objects are handed
+        to every caller that asks for these locations; the given arrays are
+        copied so they stay writable for their owner.
+
+        Args:
+            cache_key: Cache key
+            data: Tuple of (distance_matrix, duration_matrix)
+            saved_at: Timestamp the matrices were computed (for the TTL check)
+
+        Returns:
+            The stored (read-only) distance and duration matrices
+        """
+        distance_matrix = np.array(data[0], dtype=np.float32)
+        duration_matrix = np.array(data[1], dtype=np.float32)
+        distance_matrix.flags.writeable = False
+        duration_matrix.flags.writeable = False
+
+        with self._memory_cache_lock:
+            self._memory_cache[cache_key] = (saved_at, distance_matrix, duration_matrix)
+            self._memory_cache.move_to_end(cache_key)
+            while len(self._memory_cache) > self.MEMORY_CACHE_SIZE:
+                self._memory_cache.popitem(last=False)
+
+        return (distance_matrix, duration_matrix)
+
     def clear_cache(self):
         """Clear all cached distance matrices."""
+        with self._memory_cache_lock:
+            self._memory_cache.clear()
         if os.path.exists(self.cache_dir):
             for filename in os.listdir(self.cache_dir):
                 if filename.startswith("distance_matrix_"):
@@ -330,6 +490,18 @@ class DistanceCalculator:
             ]
         )
 
+    def reset_stats(self):
+        """
+        Reset cache statistics counters.
+
+        Useful when one calculator instance is reused across several
+        matrix calculations and stats should reflect only the latest one.
+        """
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.api_calls = 0
+        self.haversine_fallbacks = 0
+
     def get_cache_stats(self) -> Dict:
         """
         Get cache statistics.
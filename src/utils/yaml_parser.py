@@ -83,6 +83,21 @@ class YAMLParser:
         if not isinstance(self.data, dict):
             raise YAMLParserError("YAML file must contain a dictionary")
 
+        return self.get_fleet()
+
+    def get_fleet(self) -> VehicleFleet:
+        """
+        Build a new VehicleFleet from the already loaded YAML data.
+
+        Returns:
+            VehicleFleet object
+
+        Raises:
+            YAMLParserError: If data is not loaded or validation errors occur
+        """
+        if self.data is None:
+            raise YAMLParserError("YAML data not loaded, call parse() first")
+
         if "vehicles" not in self.data:
             raise YAMLParserError("YAML file must contain 'vehicles' key")
 
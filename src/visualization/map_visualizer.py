@@ -8,6 +8,7 @@ using Folium, showing depot, customer locations, and optimized routes.
 import folium
 from folium import plugins
 from typing import List, Tuple, Optional
+from collections import OrderedDict
 import random
 import requests
 import polyline
@@ -17,6 +18,7 @@ import json
 from pathlib import Path
 import logging
 import concurrent.futures
+import threading
 import time
 
 # Configure logger
@@ -42,6 +44,15 @@ class MapVisualizer:
     # Colors for hub markers
     HUB_COLORS = ['blue', 'green', 'purple', 'orange', 'darkred', 'cadetblue', 'darkgreen', 'darkpurple']
 
+    # Parallel OSRM route requests (kept small to avoid overwhelming the API)
+    ROAD_PATH_WORKERS = 5
+
+    # Max number of road path segments kept in memory
+    ROAD_PATH_MEMO_SIZE = 20000
+
+    # Zoom level from which stop markers are no longer clustered
+    CLUSTER_DISABLE_ZOOM = 15
+
     def __init__(self, depot: Depot, hubs_config: Optional[MultiHubConfig] = None, enable_road_routing: bool = True):
         """
         Initialize the map visualizer
@@ -62,11 +73,24 @@ class MapVisualizer:
             for i, hub_cfg in enumerate(hubs_config.hubs):
                 self.hub_color_map[hub_cfg.hub_id] = self.HUB_COLORS[i % len(self.HUB_COLORS)]
 
+        # Keep-alive HTTP session for OSRM route requests. The visualizer itself is cached
+        # by the app, so connections are reused across maps and reruns.
+        self.session = requests.Session()
+        self.session.mount(
+            "https://", requests.adapters.HTTPAdapter(pool_maxsize=self.ROAD_PATH_WORKERS)
+        )
+
         # Cache directory for route geometries
         self.cache_dir = Path(".cache/route_geometry")
         if self.enable_road_routing:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+        # In-memory LRU of road paths keyed by (start_coords, end_coords), shared by all
+        # maps built with this visualizer so switching views doesn't refetch segments.
+        # The app shares one visualizer across sessions, so the memo is lock-guarded.
+        self._road_path_memo = OrderedDict()
+        self._road_path_memo_lock = threading.Lock()
+
     def create_map(self, solution: RoutingSolution, zoom_start: int = 12) -> folium.Map:
         """
         Create an interactive Folium map with routes
@@ -82,7 +106,8 @@ class MapVisualizer:
         m = folium.Map(
             location=[self.depot.coordinates[0], self.depot.coordinates[1]],
             zoom_start=zoom_start,
-            tiles='OpenStreetMap'
+            tiles='OpenStreetMap',
+            prefer_canvas=True  # Draw lines and circles on one canvas instead of an SVG node each
         )
 
         # Add depot marker
@@ -92,17 +117,21 @@ class MapVisualizer:
         if self.hubs_config and not self.hubs_config.is_zero_hub_mode:
             self._add_hub_markers(m)
 
+        # Fetch road paths for every route in one parallel batch
+        road_paths = self.prefetch_road_paths(solution.routes)
+
         # Add routes with different colors
         for idx, route in enumerate(solution.routes):
             color = self.COLORS[idx % len(self.COLORS)]
-            self._add_route(m, route, color, idx + 1)
+            self._add_route(m, route, color, idx + 1, road_paths)
 
         # Add legend
         self._add_legend(m, solution)
 
-        # Add map controls
+        # Add map controls; the layer control toggles route groups client-side without a rerun
         folium.plugins.Fullscreen().add_to(m)
         folium.plugins.MeasureControl().add_to(m)
+        folium.LayerControl(collapsed=True).add_to(m)
 
         # Fit bounds to show all markers
         self._fit_bounds(m, solution)
@@ -130,7 +159,8 @@ class MapVisualizer:
         m = folium.Map(
             location=[self.depot.coordinates[0], self.depot.coordinates[1]],
             zoom_start=zoom_start,
-            tiles='OpenStreetMap'
+            tiles='OpenStreetMap',
+            prefer_canvas=True  # Draw lines and circles on one canvas instead of an SVG node each
         )
 
         # Add depot marker
@@ -325,7 +355,7 @@ class MapVisualizer:
                 "geometries": "polyline"
             }
 
-            response = requests.get(url, params=params, timeout=30)  # Increased timeout to 30s
+            response = self.session.get(url, params=params, timeout=30)  # Increased timeout to 30s
 
             if response.status_code == 200:
                 data = response.json()
@@ -360,7 +390,108 @@ class MapVisualizer:
         logger.debug(f"Using straight line fallback for {start_coords} -> {end_coords}")
         return [list(start_coords), list(end_coords)]
 
-    def _add_route(self, m: folium.Map, route: Route, color: str, route_number: int):
+    def _get_route_waypoints(self, route: Route) -> List[List[float]]:
+        """
+        Build list of waypoints for a route (start location -> stops -> return to start)
+
+        Args:
+            route: Route to get waypoints for
+
+        Returns:
+            List of [lat, lon] waypoints
+        """
+        # Determine starting location based on route source
+        # route.source can be "DEPOT" or a hub_id (e.g., "hub_utara")
+        source_hub = self._get_hub_by_id(route.source) if route.source != "DEPOT" else None
+        if source_hub:
+            start_coords = [source_hub.coordinates[0], source_hub.coordinates[1]]
+        else:
+            start_coords = [self.depot.coordinates[0], self.depot.coordinates[1]]
+
+        waypoints = [start_coords]
+        for stop in route.stops:
+            if stop.order is not None:  # Skip depot stops
+                lat, lon = stop.order.coordinates
+                waypoints.append([lat, lon])
+
+        # Vehicles return to their starting location
+        waypoints.append(list(start_coords))
+        return waypoints
+
+    def _get_route_segments(self, route: Route) -> List[Tuple[Tuple[float, float], Tuple[float, float]]]:
+        """Get the (start, end) coordinate pairs for each leg of a route"""
+        waypoints = self._get_route_waypoints(route)
+        return [
+            (tuple(waypoints[i]), tuple(waypoints[i + 1]))
+            for i in range(len(waypoints) - 1)
+        ]
+
+    def prefetch_road_paths(self, routes: List[Route]) -> dict:
+        """
+        Fetch road paths for all unique segments of the given routes in parallel
+
+        Segments already in memory are not fetched again. Only real road paths are
+        kept in memory; straight-line fallbacks are retried on the next render.
+
+        Args:
+            routes: Routes whose segments should be fetched
+
+        Returns:
+            Dictionary mapping (start_coords, end_coords) to a list of [lat, lon] points
+        """
+        if not self.enable_road_routing:
+            return {}
+
+        paths = {}
+        pending = []
+        memo = self._road_path_memo
+        with self._road_path_memo_lock:
+            for route in routes:
+                for segment in self._get_route_segments(route):
+                    if segment in paths:
+                        continue
+                    memo_path = memo.get(segment)
+                    paths[segment] = memo_path
+                    if memo_path is None:
+                        pending.append(segment)
+                    else:
+                        memo.move_to_end(segment)
+
+        if not pending:
+            return paths
+
+        start_time = time.time()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.ROAD_PATH_WORKERS) as executor:
+            future_to_segment = {
+                executor.submit(self._get_road_path_with_retry, start, end): (start, end)
+                for start, end in pending
+            }
+
+            for future in concurrent.futures.as_completed(future_to_segment):
+                segment = future_to_segment[future]
+                try:
+                    path = future.result()
+                except Exception as e:
+                    logger.error(f"Error fetching road path segment {segment} after retries: {e}")
+                    # Fallback to straight line
+                    path = [list(segment[0]), list(segment[1])]
+
+                paths[segment] = path
+
+        with self._road_path_memo_lock:
+            for segment in pending:
+                path = paths[segment]
+                # Paths with >2 points are actual road paths, =2 points are straight line fallbacks
+                if len(path) > 2:
+                    memo[segment] = path
+                    memo.move_to_end(segment)
+            while len(memo) > self.ROAD_PATH_MEMO_SIZE:
+                memo.popitem(last=False)
+
+        logger.info(f"Fetched {len(pending)} road path segments in {time.time() - start_time:.2f}s")
+        return paths
+
+    def _add_route(self, m: folium.Map, route: Route, color: str, route_number: int, road_paths: Optional[dict] = None):
         """
         Add a single route to the map
 
@@ -369,6 +500,7 @@ class MapVisualizer:
             route: Route to add
             color: Color for this route
             route_number: Route sequence number
+            road_paths: Road paths from prefetch_road_paths (fetched here if not given)
         """
         # Create feature group for this route (for layer control)
         route_group = folium.FeatureGroup(
@@ -376,68 +508,31 @@ class MapVisualizer:
             show=True
         )
 
-        # Build list of waypoints (start location -> stops -> return to start)
-        # Determine starting location based on route source
-        # route.source can be "DEPOT" or a hub_id (e.g., "hub_utara")
-        source_hub = self._get_hub_by_id(route.source) if route.source != "DEPOT" else None
-        if source_hub:
-            start_coords = [source_hub.coordinates[0], source_hub.coordinates[1]]
-        else:
-            start_coords = [self.depot.coordinates[0], self.depot.coordinates[1]]
-        waypoints = [start_coords]
+        # Stop markers are clustered per route so zoomed-out maps stay light
+        marker_cluster = plugins.MarkerCluster(
+            disableClusteringAtZoom=self.CLUSTER_DISABLE_ZOOM
+        ).add_to(route_group)
 
         # Add customer stops and create markers
         for stop in route.stops:
             if stop.order is not None:  # Skip depot stops
-                lat, lon = stop.order.coordinates
-                waypoints.append([lat, lon])
-
-                # Create marker for stop
                 self._add_stop_marker(
                     route_group,
                     stop,
                     color,
-                    route_number
+                    route_number,
+                    marker_cluster
                 )
 
-        # Add end point (vehicles return to their starting location)
-        if source_hub:
-            end_coords = [source_hub.coordinates[0], source_hub.coordinates[1]]
-        else:
-            end_coords = [self.depot.coordinates[0], self.depot.coordinates[1]]
-        waypoints.append(end_coords)
+        waypoints = self._get_route_waypoints(route)
+        tasks = self._get_route_segments(route)
 
         # Draw route lines using actual road paths
         all_road_coords = []
-        
-        # Prepare tasks for parallel execution
-        tasks = []
-        for i in range(len(waypoints) - 1):
-            start_coords = tuple(waypoints[i])
-            end_coords = tuple(waypoints[i + 1])
-            tasks.append((start_coords, end_coords))
-
-        # Execute in parallel with retry logic
         start_time = time.time()
-        # Use ThreadPoolExecutor to fetch segments in parallel
-        # Reduced workers to 5 to avoid overwhelming the API
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            # Submit all tasks
-            future_to_index = {
-                executor.submit(self._get_road_path_with_retry, start, end): i
-                for i, (start, end) in enumerate(tasks)
-            }
-
-            # Collect results in order
-            results = [None] * len(tasks)
-            for future in concurrent.futures.as_completed(future_to_index):
-                index = future_to_index[future]
-                try:
-                    results[index] = future.result()
-                except Exception as e:
-                    logger.error(f"Error fetching road path segment {index} after retries: {e}")
-                    # Fallback to straight line
-                    results[index] = [list(tasks[index][0]), list(tasks[index][1])]
+        if road_paths is None:
+            road_paths = self.prefetch_road_paths([route])
+        results = [road_paths.get(task) or [list(task[0]), list(task[1])] for task in tasks]
 
         # Combine results and count successful vs fallback paths
         successful_paths = 0
@@ -471,8 +566,15 @@ class MapVisualizer:
         # Add route group to map
         route_group.add_to(m)
 
-    def _add_stop_marker(self, route_group: folium.FeatureGroup, stop, color: str, route_number: int):
-        """Add a marker for a customer stop"""
+    def _add_stop_marker(
+        self,
+        route_group: folium.FeatureGroup,
+        stop,
+        color: str,
+        route_number: int,
+        marker_cluster: Optional[plugins.MarkerCluster] = None
+    ):
+        """Add a marker for a customer stop (icon marker goes into marker_cluster if given)"""
         lat, lon = stop.order.coordinates
 
         # Determine marker icon based on priority
@@ -540,7 +642,7 @@ class MapVisualizer:
                 icon=icon_symbol,
                 prefix='fa'
             )
-        ).add_to(route_group)
+        ).add_to(marker_cluster or route_group)
 
         # Add circle marker with sequence number
         folium.CircleMarker(
@@ -105,6 +105,17 @@ ORDER001,2025-10-08,04:00-05:00,-10.0,P001,Customer A,Address A,-6.2088,106.8456
 
         assert "Weight must be positive" in str(exc_info.value)
 
+    def test_parse_file_like_object(self, valid_csv_data):
+        """Test parsing from an in-memory buffer (e.g. an uploaded file)."""
+        import io
+
+        parser = CSVParser(io.BytesIO(valid_csv_data.encode("utf-8")))
+        orders = parser.parse()
+
+        assert len(orders) == 3
+        assert orders[1].sale_order_id == "ORDER002"
+        assert len(parser.df) == 3
+
     def test_parse_file_not_found(self):
         """Test that parser raises error for non-existent file."""
         parser = CSVParser("nonexistent_file.csv")
@@ -141,6 +152,42 @@ ORDER001,2025-10-08,04:00-05:00,-10.0,P001,Customer A,Address A,-6.2088,106.8456
         assert orders[1].is_priority is True
         assert orders[2].is_priority is False
 
+    def test_get_summary(self, valid_csv_file):
+        """Test summary stats match the parsed orders."""
+        parser = CSVParser(valid_csv_file)
+        orders = parser.parse()
+        summary = parser.get_summary()
+
+        assert summary["total_rows"] == len(orders)
+        assert summary["total_weight"] == pytest.approx(sum(o.load_weight_in_kg for o in orders))
+        assert summary["priority_orders"] == sum(1 for o in orders if o.is_priority)
+
+    def test_get_summary_non_numeric_weight(self):
+        """Test a non-numeric weight cell is left out of the total instead of raising."""
+        parser = CSVParser()
+        parser.df = pd.DataFrame({
+            "sale_order_id": ["SO1", "SO2", "SO3"],
+            "partner_id": ["P1", "P2", "P3"],
+            "load_weight_in_kg": ["10.5", "n/a", "4"],
+            "delivery_date": ["2025-01-01"] * 3,
+        })
+
+        summary = parser.get_summary()
+
+        assert summary["total_weight"] == pytest.approx(14.5)
+
+    def test_get_summary_priority_formats(self):
+        """Test priority counting handles the same formats as _parse_boolean."""
+        parser = CSVParser()
+        values = ["true", " Yes ", "0", "1", "false", None, "y"]
+        expected = sum(
+            parser._parse_boolean(v) for v in values if v is not None
+        )
+
+        result = parser._parse_boolean_column(pd.Series(values, dtype=object))
+
+        assert int(result.sum()) == expected == 4
+
     def test_parse_empty_csv(self):
         """Test parsing empty CSV file."""
         data = """sale_order_id,delivery_date,delivery_time,load_weight_in_kg,partner_id,display_name,alamat,partner_latitude,partner_longitude,is_priority"""
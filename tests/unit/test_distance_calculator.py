@@ -1,4 +1,5 @@
 """Unit tests for distance calculator."""
+import os
 import pytest
 import numpy as np
 from unittest.mock import Mock, patch, MagicMock
@@ -133,6 +134,167 @@ class TestDistanceCalculator:
 
             np.testing.assert_array_equal(dist_matrix1, dist_matrix2)
             np.testing.assert_array_equal(dur_matrix1, dur_matrix2)
+            assert dist_matrix2.dtype == np.float32
+            assert os.listdir(temp_cache)[0].endswith(".npz")
+
+        finally:
+            shutil.rmtree(temp_cache)
+
+    @patch('src.utils.distance_calculator.requests.get')
+    def test_reset_stats(self, mock_get, sample_locations, mock_osrm_response_success):
+        """Test that stats can be reset when a calculator is reused."""
+        import tempfile
+        import shutil
+
+        temp_cache = tempfile.mkdtemp()
+
+        try:
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = mock_osrm_response_success
+            mock_get.return_value = mock_response
+
+            calc = DistanceCalculator(cache_dir=temp_cache)
+            calc.calculate_matrix(sample_locations)
+            calc.calculate_matrix(sample_locations)
+            assert calc.cache_hits == 1
+            assert calc.api_calls == 1
+
+            calc.reset_stats()
+            stats = calc.get_cache_stats()
+            assert stats["cache_hits"] == 0
+            assert stats["cache_misses"] == 0
+            assert stats["api_calls"] == 0
+            assert stats["cached_files"] == 1  # Files on disk are untouched
+
+        finally:
+            shutil.rmtree(temp_cache)
+
+    @patch('src.utils.distance_calculator.requests.get')
+    def test_per_call_stats(self, mock_get, sample_locations, mock_osrm_response_success):
+        """Test that the stats argument reports only that call, not the shared counters."""
+        import requests
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = mock_osrm_response_success
+        mock_get.return_value = mock_response
+
+        calc = DistanceCalculator(enable_cache=False)
+        calc.calculate_matrix(sample_locations)
+
+        stats = {}
+        calc.calculate_matrix(sample_locations, stats=stats)
+        assert stats == {"cache_hits": 0, "api_calls": 1, "haversine_fallbacks": 0}
+        assert calc.api_calls == 2
+
+        mock_get.side_effect = requests.exceptions.RequestException("API Error")
+        calc.calculate_matrix(sample_locations, stats=stats)
+        assert stats["haversine_fallbacks"] == 1
+
+    @patch('src.utils.distance_calculator.requests.get')
+    def test_calculate_matrix_split_into_blocks(self, mock_get, sample_locations):
+        """Test that large location sets are fetched as source/destination blocks."""
+        def fake_table(url, params, timeout):
+            # Distance (m) = 1000 * (source coordinate position + 1), duration (s) = 60 * same
+            n_coords = len(url.rsplit("/", 1)[1].split(";"))
+            sources = [int(i) for i in params["sources"].split(";")]
+            destinations = [int(i) for i in params["destinations"].split(";")]
+            assert n_coords == len(sources) + len(destinations)
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = {
+                "code": "Ok",
+                "distances": [[1000.0 * (s + 1) for _ in destinations] for s in sources],
+                "durations": [[60.0 * (s + 1) for _ in destinations] for s in sources],
+            }
+            return response
+
+        mock_get.side_effect = fake_table
+
+        calc = DistanceCalculator(enable_cache=False)
+        calc.MAX_TABLE_SIZE = 2  # One source and one destination per request
+        dist_matrix, dur_matrix = calc.calculate_matrix(sample_locations)
+
+        n = len(sample_locations)
+        assert mock_get.call_count == n * n
+        assert calc.api_calls == n * n
+        assert calc.haversine_fallbacks == 0
+        np.testing.assert_array_equal(dist_matrix, np.ones((n, n)))
+        np.testing.assert_array_equal(dur_matrix, np.ones((n, n)))
+
+    @patch('src.utils.distance_calculator.requests.get')
+    def test_calculate_matrix_unreachable_pairs(self, mock_get, sample_locations, mock_osrm_response_success):
+        """Test that null (unreachable) entries fall back to Haversine."""
+        mock_osrm_response_success["distances"][0][2] = None
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = mock_osrm_response_success
+        mock_get.return_value = mock_response
+
+        calc = DistanceCalculator(enable_cache=False)
+        dist_matrix, _ = calc.calculate_matrix(sample_locations)
+
+        assert calc.haversine_fallbacks == 1
+        assert not np.isnan(dist_matrix).any()
+
+    @patch('src.utils.distance_calculator.requests.get')
+    def test_load_cached_matrix(self, mock_get, sample_locations, mock_osrm_response_success):
+        """Test loading matrices from disk cache without calling the API."""
+        import tempfile
+        import shutil
+
+        temp_cache = tempfile.mkdtemp()
+
+        try:
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = mock_osrm_response_success
+            mock_get.return_value = mock_response
+
+            calc = DistanceCalculator(cache_dir=temp_cache)
+            assert calc.load_cached_matrix(sample_locations) is None
+
+            dist_matrix, dur_matrix = calc.calculate_matrix(sample_locations)
+            cached = calc.load_cached_matrix(sample_locations)
+
+            assert cached is not None
+            np.testing.assert_array_equal(cached[0], dist_matrix)
+            np.testing.assert_array_equal(cached[1], dur_matrix)
+            assert mock_get.call_count == 1
+
+        finally:
+            shutil.rmtree(temp_cache)
+
+    @patch('src.utils.distance_calculator.requests.get')
+    def test_memory_cache(self, mock_get, sample_locations, mock_osrm_response_success):
+        """Test that repeat lookups are served from memory without reading the disk cache."""
+        import tempfile
+        import shutil
+
+        temp_cache = tempfile.mkdtemp()
+
+        try:
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = mock_osrm_response_success
+            mock_get.return_value = mock_response
+
+            calc = DistanceCalculator(cache_dir=temp_cache)
+            dist_matrix1, _ = calc.calculate_matrix(sample_locations)
+
+            with patch('src.utils.distance_calculator.np.load') as mock_load:
+                dist_matrix2, _ = calc.calculate_matrix(sample_locations)
+                assert not mock_load.called
+
+            assert mock_get.call_count == 1
+            np.testing.assert_array_equal(dist_matrix2, dist_matrix1)
+            assert dist_matrix1.flags.writeable  # The computed matrix stays the caller's own
+            assert not dist_matrix2.flags.writeable  # Shared between callers
+            assert calc.calculate_matrix(sample_locations)[0] is dist_matrix2
+
+            calc.clear_cache()
+            assert calc.load_cached_matrix(sample_locations) is None
 
         finally:
             shutil.rmtree(temp_cache)
@@ -182,3 +182,35 @@ unlimited: false"""
             assert fleet.unlimited is False
         finally:
             os.unlink(temp_path)
+
+    def test_get_fleet_builds_new_fleet(self):
+        """Test get_fleet() rebuilds the fleet from loaded data without re-reading the file."""
+        data = """vehicles:
+  - name: "Sepeda Motor"
+    capacity: 80
+    cost_per_km: 1500
+    fixed_count: 2
+    unlimited: true"""
+
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.yaml') as f:
+            f.write(data)
+            temp_path = f.name
+
+        try:
+            parser = YAMLParser(temp_path)
+            fleet = parser.parse()
+        finally:
+            os.unlink(temp_path)
+
+        # File is gone, but the loaded data is enough to build another fleet
+        other_fleet = parser.get_fleet()
+        assert other_fleet is not fleet
+        assert other_fleet.vehicle_types[0][0].name == "Sepeda Motor"
+        assert other_fleet.vehicle_types[0][1] == 2
+
+    def test_get_fleet_requires_parse(self):
+        """Test get_fleet() raises if parse() was not called."""
+        parser = YAMLParser("conf.yaml")
+
+        with pytest.raises(YAMLParserError):
+            parser.get_fleet()